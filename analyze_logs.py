@@ -1,6 +1,67 @@
 import re
 import os
-import statistics
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# The Numba kernel is optional: without it parse_log falls back to the
+# pure-regex path below.
+try:
+    from analyze_logs_kernel import parse_buffer as _parse_buffer
+except ImportError:
+    _parse_buffer = None
+
+# Compiled once at import time so repeated calls do not pay re.compile overhead.
+# Both patterns start with a plain literal (no anchor or word boundary) so the
+# regex engine can skip ahead with its fast literal-prefix search.
+_TICK_RE = re.compile(rb"Machine (\S+) initialized with tick rate (\d+) ticks per second")
+_EVENT_RE = re.compile(rb"updated logical clock to (\d+), system_time=(\d+)(?:, queue_length=(\d+))?")
+
+def parse_log(filepath):
+    """
+    Parses a log file in a single pass, extracting both the tick rate and the
+    event array, so each file is opened and scanned exactly once.
+
+    Returns a tuple (tick_rate, events) where tick_rate is an integer (or None
+    if the initialization line was not found) and events is an int64 NumPy
+    array of shape (n, 3) with columns
+      (logical_clock, system_time, queue_length)
+    where queue_length is -1 for events that did not report one.
+    """
+    tick_rate = None
+    events = []
+    # Map the whole file and sweep it with finditer: no per-line decoding or
+    # line splitting, just the regex engine's literal search running in C.
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return tick_rate, np.empty((0, 3), dtype=np.int64)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            tick_match = _TICK_RE.search(mm)
+            if tick_match:
+                tick_rate = int(tick_match.group(2))
+            if _parse_buffer is not None:
+                # Native-code path: stream the bytes through the Numba kernel
+                # into preallocated int64 columns (one event per line at most).
+                buf = np.frombuffer(mm, dtype=np.uint8)
+                capacity = int(np.count_nonzero(buf == ord('\n'))) + 1
+                out_lc = np.empty(capacity, dtype=np.int64)
+                out_st = np.empty(capacity, dtype=np.int64)
+                out_q = np.empty(capacity, dtype=np.int64)
+                n = _parse_buffer(buf, out_lc, out_st, out_q)
+                return tick_rate, np.stack((out_lc[:n], out_st[:n], out_q[:n]), axis=1)
+            for match in _EVENT_RE.finditer(mm):
+                logical_clock = int(match.group(1))
+                system_time = int(match.group(2))
+                queue_length = int(match.group(3)) if match.group(3) is not None else -1
+                events.append((logical_clock, system_time, queue_length))
+        finally:
+            buf = None  # release any mmap view before closing the mapping
+            mm.close()
+    if not events:
+        return tick_rate, np.empty((0, 3), dtype=np.int64)
+    return tick_rate, np.array(events, dtype=np.int64)
 
 def get_tick_rate(filepath):
     """
@@ -9,13 +70,8 @@ def get_tick_rate(filepath):
       "Machine <machine_id> initialized with tick rate <tick_rate> ticks per second"
     Returns the tick rate as an integer if found, or None otherwise.
     """
-    pattern = re.compile(r"Machine\s+(\S+)\s+initialized with tick rate (\d+) ticks per second")
-    with open(filepath, 'r') as f:
-        for line in f:
-            match = pattern.search(line)
-            if match:
-                return int(match.group(2))
-    return None
+    tick_rate, _ = parse_log(filepath)
+    return tick_rate
 
 def process_log_file(filepath):
     """
@@ -23,66 +79,97 @@ def process_log_file(filepath):
       (logical_clock, system_time, queue_length)
     where queue_length is None if not present.
     """
-    events = []
-    # Regex pattern matches lines with "updated logical clock to" and captures:
-    # the clock value, the system_time, and optionally the queue_length.
-    pattern = re.compile(r"updated logical clock to (\d+), system_time=(\d+)(?:, queue_length=(\d+))?")
-    with open(filepath, 'r') as f:
-        for line in f:
-            match = pattern.search(line)
-            if match:
-                logical_clock = int(match.group(1))
-                system_time = int(match.group(2))
-                queue_length = int(match.group(3)) if match.group(3) is not None else None
-                events.append((logical_clock, system_time, queue_length))
-    return events
+    _, events = parse_log(filepath)
+    return [(int(lc), int(st), int(q) if q >= 0 else None) for lc, st, q in events]
 
 def compute_jumps(events):
-    """Computes the differences (jumps) between consecutive logical clock values."""
-    jumps = []
-    # Ensure events are sorted by system_time.
-    events.sort(key=lambda x: x[1])
-    for i in range(1, len(events)):
-        jump = events[i][0] - events[i-1][0]
-        jumps.append(jump)
-    return jumps
+    """
+    Computes the differences (jumps) between consecutive logical clock values
+    as an int64 NumPy array, ordering events by system_time first.
 
-def analyze_run(run_dir, machine_ids):
-    """Analyzes the log files in a given run directory and prints statistics."""
+    Accepts either the (n, 3) array returned by parse_log or a list of
+    (logical_clock, system_time, ...) tuples.
+    """
+    if not isinstance(events, np.ndarray):
+        events = np.array([e[:2] for e in events], dtype=np.int64)
+    if len(events) < 2:
+        return np.empty(0, dtype=np.int64)
+    # Log lines are written in time order, so system_time is almost always
+    # already monotonic: verify with a linear scan and only fall back to the
+    # O(n log n) sort when it is not.
+    system_times = events[:, 1]
+    if np.all(system_times[1:] >= system_times[:-1]):
+        clocks = events[:, 0]
+    else:
+        clocks = events[np.argsort(system_times, kind='stable'), 0]
+    return np.diff(clocks)
+
+def summarize_log(filepath):
+    """
+    Parses a log file and immediately reduces it to summary statistics, so
+    the per-event array only lives for the duration of this call instead of
+    being held (and re-scanned) by the caller.
+
+    Returns a dict with keys tick_rate, final_clock, avg_jump, min_jump,
+    max_jump, std_jump and avg_queue.
+    """
+    tick_rate, events = parse_log(filepath)
+    jumps = compute_jumps(events)
+    if len(jumps):
+        avg_jump = jumps.mean()
+        max_jump = jumps.max()
+        min_jump = jumps.min()
+        std_jump = jumps.std(ddof=1) if len(jumps) > 1 else 0
+    else:
+        avg_jump = max_jump = min_jump = std_jump = 0
+
+    # Average queue length over the events that include one.
+    queue_lengths = events[events[:, 2] >= 0, 2]
+    avg_queue = queue_lengths.mean() if len(queue_lengths) else 0
+
+    return {
+        'tick_rate': tick_rate,
+        'final_clock': int(events[-1, 0]) if len(events) else 0,
+        'avg_jump': avg_jump,
+        'min_jump': min_jump,
+        'max_jump': max_jump,
+        'std_jump': std_jump,
+        'avg_queue': avg_queue,
+    }
+
+def parse_one(run_dir, machine):
+    """
+    Summarizes a single machine's log in run_dir, returning the stats dict
+    from summarize_log, or None if the log file does not exist. Standalone
+    top-level function so it can run as a process-pool task.
+    """
+    logfile = os.path.join(run_dir, f"{machine}_log.txt")
+    if not os.path.exists(logfile):
+        return None
+    return summarize_log(logfile)
+
+def _parse_one_star(task):
+    """Unpacks a (run_dir, machine) task for executor.map."""
+    return parse_one(*task)
+
+def print_run(run_dir, machine_stats):
+    """Prints the statistics for one run given {machine: stats-or-None}."""
     print(f"\nStatistics for run: {run_dir}")
     drift_end = {}
-    for machine in machine_ids:
-        logfile = os.path.join(run_dir, f"{machine}_log.txt")
-        if not os.path.exists(logfile):
+    for machine, stats in machine_stats.items():
+        if stats is None:
             continue
-        # Get the tick rate (clock cycle value) from the initialization line.
-        tick_rate = get_tick_rate(logfile)
-        events = process_log_file(logfile)
-        jumps = compute_jumps(events)
-        if jumps:
-            avg_jump = statistics.mean(jumps)
-            max_jump = max(jumps)
-            min_jump = min(jumps)
-            std_jump = statistics.stdev(jumps) if len(jumps) > 1 else 0
-        else:
-            avg_jump = max_jump = min_jump = std_jump = 0
-
-        # Get the final logical clock value.
-        final_value = events[-1][0] if events else 0
-        drift_end[machine] = final_value
-
-        # Compute average queue length for events that include a queue_length.
-        queue_lengths = [e[2] for e in events if e[2] is not None]
-        avg_queue = statistics.mean(queue_lengths) if queue_lengths else 0
+        drift_end[machine] = stats['final_clock']
 
         print(f"  {machine}:")
-        if tick_rate is not None:
-            print(f"    Clock cycle (tick rate): {tick_rate} ticks per second")
+        if stats['tick_rate'] is not None:
+            print(f"    Clock cycle (tick rate): {stats['tick_rate']} ticks per second")
         else:
             print("    Clock cycle (tick rate): Not found")
-        print(f"    Final logical clock: {final_value}")
-        print(f"    Jump sizes: avg = {avg_jump:.2f}, min = {min_jump}, max = {max_jump}, std = {std_jump:.2f}")
-        print(f"    Average message queue length: {avg_queue:.2f}")
+        print(f"    Final logical clock: {stats['final_clock']}")
+        print(f"    Jump sizes: avg = {stats['avg_jump']:.2f}, min = {stats['min_jump']}, "
+              f"max = {stats['max_jump']}, std = {stats['std_jump']:.2f}")
+        print(f"    Average message queue length: {stats['avg_queue']:.2f}")
 
     if drift_end:
         drift = max(drift_end.values()) - min(drift_end.values())
@@ -90,16 +177,31 @@ def analyze_run(run_dir, machine_ids):
     else:
         print("  No data available.\n")
 
+def analyze_run(run_dir, machine_ids):
+    """Analyzes the log files in a given run directory and prints statistics."""
+    print_run(run_dir, {machine: parse_one(run_dir, machine) for machine in machine_ids})
+
 def main():
     # List of run directories and machine IDs.
     runs = [f"experiments/experiment_run_{i}" for i in range(1, 6)]
     machine_ids = ["machine1", "machine2", "machine3", "machine4"]
 
+    existing_runs = []
     for run in runs:
         if os.path.isdir(run):
-            analyze_run(run, machine_ids)
+            existing_runs.append(run)
         else:
             print(f"Run directory {run} does not exist.")
 
+    # One process-pool task per log file: the parses are independent and
+    # CPU-bound, so they scale out to the available cores.
+    tasks = [(run, machine) for run in existing_runs for machine in machine_ids]
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_parse_one_star, tasks))
+
+    for i, run in enumerate(existing_runs):
+        run_results = results[i * len(machine_ids):(i + 1) * len(machine_ids)]
+        print_run(run, dict(zip(machine_ids, run_results)))
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
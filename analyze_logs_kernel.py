@@ -0,0 +1,98 @@
+"""
+Numba-compiled parsing kernel for analyze_logs.py.
+
+Scans a raw uint8 view of a log file for event lines of the form
+  "updated logical clock to <n>, system_time=<n>[, queue_length=<n>]"
+and writes the three integers into preallocated int64 output arrays,
+so the hot parse loop runs as native code with no regex engine or
+Python object creation involved.
+"""
+import numpy as np
+from numba import njit, types
+
+# Byte literals the kernel matches against, as uint8 arrays so they can be
+# indexed from nopython code.
+_EVENT_LIT = np.frombuffer(b"updated logical clock to ", dtype=np.uint8)
+_ST_LIT = np.frombuffer(b", system_time=", dtype=np.uint8)
+_QL_LIT = np.frombuffer(b", queue_length=", dtype=np.uint8)
+
+# An explicit signature forces compilation at import time (combined with
+# cache=True) so the first parse_log call does not pay JIT warmup. The input
+# buffer is a read-only view over an mmap, hence the readonly array type.
+_SIGNATURE = types.int64(
+    types.Array(types.uint8, 1, 'C', readonly=True),
+    types.int64[::1], types.int64[::1], types.int64[::1],
+)
+
+@njit(_SIGNATURE, cache=True)
+def parse_buffer(buf, out_lc, out_st, out_q):
+    """
+    Parses every event occurrence in buf, filling out_lc, out_st and out_q
+    (queue length, -1 when absent). Returns the number of events found.
+    The output arrays must be at least as long as the number of events.
+    """
+    size = buf.shape[0]
+    lit_len = _EVENT_LIT.shape[0]
+    st_len = _ST_LIT.shape[0]
+    ql_len = _QL_LIT.shape[0]
+    n = 0
+    i = 0
+    while i + lit_len <= size:
+        # Match the leading literal "updated logical clock to ".
+        if buf[i] != _EVENT_LIT[0]:
+            i += 1
+            continue
+        matched = True
+        for k in range(1, lit_len):
+            if buf[i + k] != _EVENT_LIT[k]:
+                matched = False
+                break
+        if not matched:
+            i += 1
+            continue
+        j = i + lit_len
+
+        # Logical clock digits.
+        logical_clock = 0
+        while j < size and 48 <= buf[j] <= 57:
+            logical_clock = logical_clock * 10 + (buf[j] - 48)
+            j += 1
+
+        # ", system_time=" is mandatory for a well-formed event line.
+        if j + st_len > size:
+            break
+        matched = True
+        for k in range(st_len):
+            if buf[j + k] != _ST_LIT[k]:
+                matched = False
+                break
+        if not matched:
+            i = j
+            continue
+        j += st_len
+        system_time = 0
+        while j < size and 48 <= buf[j] <= 57:
+            system_time = system_time * 10 + (buf[j] - 48)
+            j += 1
+
+        # Optional ", queue_length=" suffix.
+        queue_length = -1
+        if j + ql_len <= size:
+            matched = True
+            for k in range(ql_len):
+                if buf[j + k] != _QL_LIT[k]:
+                    matched = False
+                    break
+            if matched:
+                j += ql_len
+                queue_length = 0
+                while j < size and 48 <= buf[j] <= 57:
+                    queue_length = queue_length * 10 + (buf[j] - 48)
+                    j += 1
+
+        out_lc[n] = logical_clock
+        out_st[n] = system_time
+        out_q[n] = queue_length
+        n += 1
+        i = j
+    return n
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x63lock.proto\x12\x11\x64istributed_clock\"K\n\x0c\x43lockMessage\x12\x11\n\tsender_id\x18\x01 \x01(\x05\x12\x15\n\rlogical_clock\x18\x02 \x01(\x05\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"!\n\rClockResponse\x12\x10\n\x08received\x18\x01 \x01(\x08\x32\x62\n\x0c\x43lockService\x12R\n\x0bSendMessage\x12\x1f.distributed_clock.ClockMessage\x1a .distributed_clock.ClockResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x63lock.proto\x12\x11\x64istributed_clock\"K\n\x0c\x43lockMessage\x12\x11\n\tsender_id\x18\x01 \x01(\x05\x12\x15\n\rlogical_clock\x18\x02 \x01(\x05\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"!\n\rClockResponse\x12\x10\n\x08received\x18\x01 \x01(\x08\x32\xbc\x01\n\x0c\x43lockService\x12R\n\x0bSendMessage\x12\x1f.distributed_clock.ClockMessage\x1a .distributed_clock.ClockResponse\"\x00\x12X\n\x0fSendClockStream\x12\x1f.distributed_clock.ClockMessage\x1a .distributed_clock.ClockResponse\"\x00(\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,6 +35,6 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_CLOCKMESSAGE']._serialized_end=109
   _globals['_CLOCKRESPONSE']._serialized_start=111
   _globals['_CLOCKRESPONSE']._serialized_end=144
-  _globals['_CLOCKSERVICE']._serialized_start=146
-  _globals['_CLOCKSERVICE']._serialized_end=244
+  _globals['_CLOCKSERVICE']._serialized_start=147
+  _globals['_CLOCKSERVICE']._serialized_end=335
 # @@protoc_insertion_point(module_scope)
@@ -40,6 +40,11 @@ class ClockServiceStub(object):
                 request_serializer=clock__pb2.ClockMessage.SerializeToString,
                 response_deserializer=clock__pb2.ClockResponse.FromString,
                 _registered_method=True)
+        self.SendClockStream = channel.stream_unary(
+                '/distributed_clock.ClockService/SendClockStream',
+                request_serializer=clock__pb2.ClockMessage.SerializeToString,
+                response_deserializer=clock__pb2.ClockResponse.FromString,
+                _registered_method=True)
 
 
 class ClockServiceServicer(object):
@@ -53,6 +58,13 @@ class ClockServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SendClockStream(self, request_iterator, context):
+        """Stream clock messages over one long-lived call
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ClockServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -61,6 +73,11 @@ def add_ClockServiceServicer_to_server(servicer, server):
                     request_deserializer=clock__pb2.ClockMessage.FromString,
                     response_serializer=clock__pb2.ClockResponse.SerializeToString,
             ),
+            'SendClockStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.SendClockStream,
+                    request_deserializer=clock__pb2.ClockMessage.FromString,
+                    response_serializer=clock__pb2.ClockResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_clock.ClockService', rpc_method_handlers)
@@ -99,3 +116,30 @@ class ClockService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def SendClockStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/distributed_clock.ClockService/SendClockStream',
+            clock__pb2.ClockMessage.SerializeToString,
+            clock__pb2.ClockResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
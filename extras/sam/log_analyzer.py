@@ -1,9 +1,197 @@
 import re
 import os
+import array
 import datetime
-import matplotlib.pyplot as plt
 import numpy as np
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# The Numba kernels are optional: without them the analyzer keeps its NumPy
+# implementations of the same array math.
+try:
+    from log_analyzer_kernel import positive_jumps as _jumps_kernel
+    from log_analyzer_kernel import nearest_clocks as _nearest_kernel
+except ImportError:
+    _jumps_kernel = None
+    _nearest_kernel = None
+
+# The mandatory event-type / system-time / logical-clock triple sits after
+# fixed literals in every line, so the parse loop extracts it with str.find
+# and slicing (C-level substring search) instead of the regex engine. Only
+# the optional per-event-type suffixes keep small compiled patterns.
+_QLEN_RE = re.compile(rb'Queue Length: (\d+)')
+_SENDER_RE = re.compile(rb'From: Machine (\d+)')
+
+def _parse_timestamp(s):
+    """Parse a b'YYYY-MM-DD HH:MM:SS.ffffff' field by fixed-offset slicing.
+
+    The log timestamps are machine-generated with this exact layout, so the
+    fields can be sliced out directly instead of paying strptime's format
+    interpretation on every line (int() accepts the raw byte slices)."""
+    return datetime.datetime(
+        int(s[0:4]), int(s[5:7]), int(s[8:10]),
+        int(s[11:13]), int(s[14:16]), int(s[17:19]),
+        int(s[20:26].ljust(6, b'0')),
+    )
+
+# Event type codes for the 'type' column of the per-machine event arrays.
+_EVENT_NAMES = ('SEND', 'RECEIVE', 'INTERNAL')
+_EVENT_CODES = {name: code for code, name in enumerate(_EVENT_NAMES)}
+
+def _compute_clock_jumps(machine_id, events):
+    """Compute the positive logical clock jumps for one machine's events.
+
+    One np.diff over the clock column replaces a per-event Python loop.
+    Logical clocks should always increment: a 0 or negative jump is likely a
+    log parsing issue or out-of-order events, so those rare indices fall back
+    to Python for a warning message and are excluded from the result."""
+    clocks = events['clock']
+    if len(clocks) < 2:
+        return np.empty(0, dtype=np.int64)
+
+    if _jumps_kernel is not None:
+        out_jumps = np.empty(len(clocks) - 1, dtype=np.int64)
+        out_bad = np.empty(len(clocks) - 1, dtype=np.int64)
+        n_jumps, n_bad = _jumps_kernel(clocks, out_jumps, out_bad)
+        bad = out_bad[:n_bad]
+        jumps = out_jumps[:n_jumps]
+    else:
+        diffs = np.diff(clocks)
+        bad = np.nonzero(diffs <= 0)[0]
+        jumps = diffs[diffs > 0]
+
+    for i in bad:
+        when = datetime.datetime.fromtimestamp(events['ts'][i + 1] / 1e6)
+        print(f"Warning: Non-positive clock jump detected in Machine {machine_id}: " +
+              f"From {clocks[i]} to {clocks[i + 1]} at {when}")
+
+    return jumps
+
+def _parse_one_file(task):
+    """Parses one machine's log file; module-level so it pickles as a
+    process-pool task.
+
+    task is a (log_dir, log_file) tuple. Returns a tuple
+      (machine_id, events, queue_lengths, clock_jumps, comms)
+    where events is a structure-of-arrays dict (see the column list in
+    LogAnalyzer.__init__), queue_lengths is an (int64 timestamps, int64
+    lengths) column pair, and comms maps sender_id -> message count received
+    by this machine, ready to be merged into the analyzer's structures."""
+    log_dir, log_file = task
+    machine_id = int(log_file.split('_')[1].split('.')[0])
+
+    # Per-event columns, accumulated as plain lists and converted to NumPy
+    # arrays at the end. Optional fields use -1 for "not present". The queue
+    # series accumulates straight into compact int64 buffers: no per-sample
+    # tuple or datetime objects.
+    ts_col = []
+    type_col = []
+    clock_col = []
+    sender_col = []
+    queue_col = []
+    dest_col = []
+
+    queue_ts = array.array('q')
+    queue_len = array.array('q')
+    comms = defaultdict(int)
+
+    # Binary mode with a 1 MiB read buffer: fewer read syscalls on large
+    # logs, and the ascii lines parse fine as bytes with no decode step.
+    with open(os.path.join(log_dir, log_file), 'rb', buffering=1 << 20) as f:
+        for line in f:
+            # Hand-parse the rigid timestamp/event/clock skeleton: every
+            # field sits after a fixed literal, so bytes.find plus slicing
+            # replaces the regex engine on the mandatory part of the line.
+            st_pos = line.find(b'System Time: ')
+            if st_pos == -1:
+                continue
+            head = line[:st_pos]
+            if head.endswith(b'INTERNAL - '):
+                event_type = 'INTERNAL'
+            elif head.endswith(b'SEND - '):
+                event_type = 'SEND'
+            elif head.endswith(b'RECEIVE - '):
+                event_type = 'RECEIVE'
+            else:
+                continue
+
+            ts_start = st_pos + 13
+            ts_end = line.find(b',', ts_start)
+            # Require the fractional-seconds part (as the old pattern did).
+            if ts_end == -1 or ts_end - ts_start < 21:
+                continue
+            ts_us = int(_parse_timestamp(line[ts_start:ts_end]).timestamp() * 1e6)
+
+            clk_pos = line.find(b'Logical Clock: ', ts_end)
+            if clk_pos == -1:
+                continue
+            clk_start = clk_pos + 15
+            clk_end = line.find(b',', clk_start)
+            logical_clock = int(line[clk_start:] if clk_end == -1 else line[clk_start:clk_end])
+
+            sender_id = -1
+            queue_length = -1
+            dest_id = -1
+
+            # Sender and queue length information for RECEIVE events. Each
+            # optional suffix gets a cheap substring check before its regex
+            # runs, so lines without the field skip the regex engine entirely.
+            if event_type == 'RECEIVE':
+                if b'From: Machine' in line:
+                    sender_match = _SENDER_RE.search(line)
+                    if sender_match:
+                        sender_id = int(sender_match.group(1))
+                        # Record communication pattern
+                        comms[sender_id] += 1
+
+                if b'Queue Length:' in line:
+                    qlen_match = _QLEN_RE.search(line)
+                    if qlen_match:
+                        queue_length = int(qlen_match.group(1))
+                        queue_ts.append(ts_us)
+                        queue_len.append(queue_length)
+
+            # Destination information for SEND events. The suffix looks like
+            # "Destination: Machine at ('localhost', 50003)": the port is the
+            # digit run between the last space and the closing paren, so a
+            # str-scan replaces the old quoted-host regex.
+            elif event_type == 'SEND':
+                dest_pos = line.find(b'Destination:')
+                if dest_pos != -1:
+                    close = line.find(b')', dest_pos)
+                    if close != -1:
+                        sep = line.rfind(b' ', dest_pos, close)
+                        dest_port = int(line[sep + 1:close])
+                        # Convert port to machine ID (assuming port = 50000 + machine_id)
+                        dest_id = dest_port - 50000
+
+            ts_col.append(ts_us)
+            type_col.append(_EVENT_CODES[event_type])
+            clock_col.append(logical_clock)
+            sender_col.append(sender_id)
+            queue_col.append(queue_length)
+            dest_col.append(dest_id)
+
+    # Convert to contiguous arrays and sort every column into chronological
+    # order with one stable argsort over the timestamp column.
+    ts_arr = np.asarray(ts_col, dtype=np.int64)
+    order = np.argsort(ts_arr, kind='stable')
+    events = {
+        'ts': ts_arr[order],
+        'type': np.asarray(type_col, dtype=np.uint8)[order],
+        'clock': np.asarray(clock_col, dtype=np.int64)[order],
+        'sender_id': np.asarray(sender_col, dtype=np.int32)[order],
+        'queue_len': np.asarray(queue_col, dtype=np.int32)[order],
+        'dest_id': np.asarray(dest_col, dtype=np.int32)[order],
+    }
+
+    # Calculate jumps for this machine based on chronological order
+    clock_jumps = _compute_clock_jumps(machine_id, events)
+
+    queue_lengths = (np.frombuffer(queue_ts, dtype=np.int64),
+                     np.frombuffer(queue_len, dtype=np.int64))
+
+    return machine_id, events, queue_lengths, clock_jumps, comms
 
 class LogAnalyzer:
     def __init__(self, log_dir='.', experiment_name=None):
@@ -18,230 +206,213 @@ class LogAnalyzer:
         
         self.log_files.sort()  # Sort by machine ID
         
-        # Regular expressions for parsing log entries
-        self.timestamp_pattern = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}.\d+)'
-        self.event_pattern = r'(SEND|RECEIVE|INTERNAL)'
-        self.clock_pattern = r'Logical Clock: (\d+)'
-        self.queue_pattern = r'Queue Length: (\d+)'
-        self.sender_pattern = r'From: Machine (\d+)'
-        self.destination_pattern = r'Destination: Machine at \([\'"]?localhost[\'"]?, (\d+)\)'
-        
-        # Data structures to hold parsed log information
-        self.events = defaultdict(list)  # Machine ID -> list of event dictionaries
-        self.logical_clocks = defaultdict(list)  # Machine ID -> list of (timestamp, clock_value) tuples
-        self.queue_lengths = defaultdict(list)  # Machine ID -> list of (timestamp, queue_length) tuples
-        self.clock_jumps = defaultdict(list)  # Machine ID -> list of jump values
-        self.communication = defaultdict(lambda: defaultdict(int))  # (from_id, to_id) -> count
+
+        # Data structures to hold parsed log information.
+        # self.events maps machine ID -> structure-of-arrays dict with columns
+        #   ts (int64 microseconds), type (uint8 code into _EVENT_NAMES),
+        #   clock (int64), sender_id / queue_len / dest_id (int32, -1 if
+        #   absent), all sorted chronologically.
+        self.events = {}
+        # The clock and queue series are paired int64 column arrays
+        # (epoch-microsecond timestamps, values) rather than tuple lists.
+        self.logical_clocks = {}  # Machine ID -> (ts_us, clock_value) arrays
+        self.queue_lengths = {}  # Machine ID -> (ts_us, queue_length) arrays
+        self.clock_jumps = defaultdict(list)  # Machine ID -> array of jump values
+        self.communication = Counter()  # (from_id, to_id) -> count
+        self._clk_at_time_cache = {}  # (machine_id, time, window) -> clock value
+        # Sorted per-machine index arrays (filled by _build_indices after
+        # parsing); shared by the drift analysis and the clock plot.
+        self._sorted_ts = {}
+        self._sorted_clk = {}
         
     def parse_logs(self):
-        """Parse all log files and extract relevant information."""
-        for log_file in self.log_files:
-            machine_id = int(log_file.split('_')[1].split('.')[0])
-            
-            # List to store events for this machine
-            machine_events = []
-            
-            with open(os.path.join(self.log_dir, log_file), 'r') as f:
-                for line in f:
-                    # Extract timestamp
-                    timestamp_match = re.search(self.timestamp_pattern, line)
-                    if not timestamp_match:
-                        continue
-                    timestamp_str = timestamp_match.group(1)
-                    timestamp = datetime.datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
-                    
-                    # Extract event type
-                    event_match = re.search(self.event_pattern, line)
-                    if not event_match:
-                        continue
-                    event_type = event_match.group(1)
-                    
-                    # Extract logical clock
-                    clock_match = re.search(self.clock_pattern, line)
-                    if not clock_match:
-                        continue
-                    logical_clock = int(clock_match.group(1))
-                    
-                    # Create event dictionary
-                    event = {
-                        'timestamp': timestamp,
-                        'type': event_type,
-                        'logical_clock': logical_clock
-                    }
-                    
-                    # Add sender information for RECEIVE events
-                    if event_type == 'RECEIVE':
-                        sender_match = re.search(self.sender_pattern, line)
-                        if sender_match:
-                            sender_id = int(sender_match.group(1))
-                            event['sender_id'] = sender_id
-                            # Record communication pattern
-                            self.communication[sender_id][machine_id] += 1
-                        
-                        # Add queue length for RECEIVE events
-                        queue_match = re.search(self.queue_pattern, line)
-                        if queue_match:
-                            queue_length = int(queue_match.group(1))
-                            event['queue_length'] = queue_length
-                            self.queue_lengths[machine_id].append((timestamp, queue_length))
-                    
-                    # Add destination information for SEND events
-                    elif event_type == 'SEND':
-                        dest_match = re.search(self.destination_pattern, line)
-                        if dest_match:
-                            dest_port = int(dest_match.group(1))
-                            # Convert port to machine ID (assuming port = 50000 + machine_id)
-                            dest_id = dest_port - 50000
-                            event['destination_id'] = dest_id
-                    
-                    # Add event to the list for this machine
-                    machine_events.append(event)
-                    self.logical_clocks[machine_id].append((timestamp, logical_clock))
-            
-            # Sort events by timestamp (chronological order)
-            machine_events.sort(key=lambda e: e['timestamp'])
-            
-            # Store sorted events
-            self.events[machine_id] = machine_events
-            
-            # Calculate jumps for this machine based on chronological order
-            self.calculate_clock_jumps_for_machine(machine_id, machine_events)
+        """Parse all log files in parallel and extract relevant information.
+
+        Each file is independent until its results are merged, so the files
+        stream through a process pool (one _parse_one_file task per file) and
+        the per-file structures are folded into the analyzer's dicts here."""
+        tasks = [(self.log_dir, log_file) for log_file in self.log_files]
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_parse_one_file, tasks))
+
+        for machine_id, events, (q_ts, q_len), jumps, comms in results:
+            self.events[machine_id] = events
+            # Every event carries a timestamp and clock value, so the clock
+            # series is just a view of the (already sorted) event columns.
+            self.logical_clocks[machine_id] = (events['ts'], events['clock'])
+            if len(q_ts):
+                self.queue_lengths[machine_id] = (q_ts, q_len)
+            if len(jumps):
+                self.clock_jumps[machine_id] = jumps
+            for sender_id, count in comms.items():
+                self.communication[(sender_id, machine_id)] += count
+
+        # Build the sorted per-machine lookup arrays used by the drift analysis.
+        self._build_indices()
+
+    def _build_indices(self):
+        """Build sorted int64-microsecond timestamp and clock arrays per machine.
+
+        These back the nearest-neighbor lookups in analyze_clock_drift and
+        double as the pre-sorted series for plotting. The clock columns are
+        already chronologically sorted by the parse step, so the index is a
+        reference, not a copy."""
+        for machine_id, (ts, clk) in self.logical_clocks.items():
+            if not len(ts):
+                continue
+            self._sorted_ts[machine_id] = ts
+            self._sorted_clk[machine_id] = clk
+
+    def _nearest_clocks(self, machine_id, samples, window_us):
+        """Find the clock value nearest each sample timestamp for a machine.
+
+        samples is a sorted int64 microsecond array. np.searchsorted locates
+        the insertion point for every sample at once, so only the two
+        neighboring entries need comparing (earlier entry wins ties, matching
+        the old linear scan). Returns (clocks, valid) where valid masks the
+        samples whose nearest entry lies within the window."""
+        ts = self._sorted_ts.get(machine_id)
+        if ts is None:
+            # Machine whose log parsed to zero events (empty or truncated
+            # file): no sample has a nearby entry, so every pair involving
+            # it is skipped, as the linear scan did by returning None.
+            return (np.zeros(len(samples), dtype=np.int64),
+                    np.zeros(len(samples), dtype=np.bool_))
+        clk = self._sorted_clk[machine_id]
+        if _nearest_kernel is not None:
+            # Native path: both arrays are sorted, so the kernel finds every
+            # nearest entry with one two-pointer merge pass.
+            out_clk = np.empty(len(samples), dtype=np.int64)
+            out_valid = np.empty(len(samples), dtype=np.bool_)
+            _nearest_kernel(ts, clk, samples, window_us, out_clk, out_valid)
+            return out_clk, out_valid
+        idx = np.searchsorted(ts, samples)
+        left = np.clip(idx - 1, 0, len(ts) - 1)
+        right = np.clip(idx, 0, len(ts) - 1)
+        left_diff = np.abs(samples - ts[left])
+        right_diff = np.abs(samples - ts[right])
+        use_left = left_diff <= right_diff
+        best = np.where(use_left, left, right)
+        diff = np.where(use_left, left_diff, right_diff)
+        return clk[best], diff < window_us
     
     def calculate_clock_jumps_for_machine(self, machine_id, events):
         """Calculate jumps in logical clock values for a single machine, using events in chronological order."""
-        if not events or len(events) < 2:
-            return
-            
-        # Process events in chronological order
-        for i in range(1, len(events)):
-            prev_clock = events[i-1]['logical_clock']
-            curr_clock = events[i]['logical_clock']
-            
-            # Calculate jump
-            jump = curr_clock - prev_clock
-            
-            # Logical clocks should always increment
-            if jump > 0:
-                self.clock_jumps[machine_id].append(jump)
-            # If jump is 0 or negative, this is likely a log parsing issue or out-of-order events
-            # We'll log these as warnings but won't include them in analysis
-            elif jump <= 0:
-                print(f"Warning: Non-positive clock jump detected in Machine {machine_id}: " +
-                      f"From {prev_clock} to {curr_clock} at {events[i]['timestamp']}")
-    
+        self.clock_jumps[machine_id] = _compute_clock_jumps(machine_id, events)
+
     def analyze_clock_jumps(self):
         """Analyze the jumps in logical clock values."""
         print("\n=== Logical Clock Jumps Analysis ===")
         for machine_id, jumps in self.clock_jumps.items():
-            if jumps:
-                avg_jump = sum(jumps) / len(jumps)
-                max_jump = max(jumps)
-                min_jump = min(jumps)
+            if len(jumps):
                 print(f"Machine {machine_id}:")
-                print(f"  Average jump: {avg_jump:.2f}")
-                print(f"  Maximum jump: {max_jump}")
-                print(f"  Minimum jump: {min_jump}")
-                
+                print(f"  Average jump: {jumps.mean():.2f}")
+                print(f"  Maximum jump: {jumps.max()}")
+                print(f"  Minimum jump: {jumps.min()}")
+
                 # Count occurrences of each jump value
-                jump_counter = Counter(jumps)
-                most_common_jumps = jump_counter.most_common(3)
+                values, counts = np.unique(jumps, return_counts=True)
+                order = np.argsort(-counts, kind='stable')[:3]
+                most_common_jumps = [(int(values[k]), int(counts[k])) for k in order]
                 print(f"  Most common jumps: {most_common_jumps}")
                 print()
     
     def find_clock_at_time(self, machine_id, target_time, window_ms=100):
-        """Find the logical clock value closest to the target time within a window."""
-        window = datetime.timedelta(milliseconds=window_ms)
+        """Find the logical clock value closest to the target time within a window.
+
+        target_time is a datetime; the stored columns are int64 epoch
+        microseconds, so the comparison runs as one vectorized subtraction.
+        Results are memoized per (machine, time, window): repeated lookups of
+        the same sample point hit the cache instead of rescanning."""
+        key = (machine_id, target_time, window_ms)
+        if key in self._clk_at_time_cache:
+            return self._clk_at_time_cache[key]
+
         best_match = None
-        min_diff = datetime.timedelta.max
-        
-        for time, clock in self.logical_clocks[machine_id]:
-            diff = abs(time - target_time)
-            if diff < window and diff < min_diff:
-                min_diff = diff
-                best_match = clock
-                
+        if machine_id in self.logical_clocks:
+            ts, clk = self.logical_clocks[machine_id]
+            if len(ts):
+                target_us = int(target_time.timestamp() * 1e6)
+                diffs = np.abs(ts - target_us)
+                nearest = diffs.argmin()
+                if diffs[nearest] < window_ms * 1000:
+                    best_match = int(clk[nearest])
+
+        self._clk_at_time_cache[key] = best_match
         return best_match
     
     def analyze_clock_drift(self):
         """Analyze the drift between logical clocks of different machines."""
         print("\n=== Logical Clock Drift Analysis ===")
         
-        # Get the list of all timestamps from all machines
-        all_timestamps = []
-        for machine_id, clock_data in self.logical_clocks.items():
-            all_timestamps.extend([ts for ts, _ in clock_data])
-        
-        # Remove duplicates and sort
-        all_timestamps = sorted(set(all_timestamps))
-        
-        if not all_timestamps:
+        # Deduplicated, sorted timestamps from all machines: one np.unique
+        # over the concatenated int64 columns.
+        ts_columns = [ts for ts, _ in self.logical_clocks.values() if len(ts)]
+        all_timestamps = np.unique(np.concatenate(ts_columns)) if ts_columns \
+            else np.empty(0, dtype=np.int64)
+
+        if not len(all_timestamps):
             print("No timestamp data available for analysis.")
             return
-        
-        # Define time window for comparison (in milliseconds)
-        window_ms = 100
-        
-        # Calculate drift between each pair of machines
+
+        # Define time window for comparison (100 ms, in microseconds)
+        window_us = 100 * 1000
+
+        # Sample timestamps at regular intervals to avoid too much data.
+        sample_size = min(100, len(all_timestamps))
+        step = max(1, len(all_timestamps) // sample_size)
+        samples = all_timestamps[::step]
+
+        # Calculate drift between each pair of machines, one vectorized
+        # nearest-neighbor lookup per machine per pair.
         machine_ids = sorted(self.logical_clocks.keys())
         for i in range(len(machine_ids)):
             for j in range(i+1, len(machine_ids)):
                 machine1 = machine_ids[i]
                 machine2 = machine_ids[j]
-                
-                drifts = []
-                # Sample timestamps at regular intervals to avoid too much data
-                sample_size = min(100, len(all_timestamps))
-                step = max(1, len(all_timestamps) // sample_size)
-                
-                for k in range(0, len(all_timestamps), step):
-                    if k >= len(all_timestamps):
-                        break
-                        
-                    time_point = all_timestamps[k]
-                    clock1 = self.find_clock_at_time(machine1, time_point, window_ms)
-                    clock2 = self.find_clock_at_time(machine2, time_point, window_ms)
-                    
-                    if clock1 is not None and clock2 is not None:
-                        drift = abs(clock1 - clock2)
-                        drifts.append(drift)
-                
-                if drifts:
-                    avg_drift = sum(drifts) / len(drifts)
-                    max_drift = max(drifts)
-                    min_drift = min(drifts)
+
+                clocks1, valid1 = self._nearest_clocks(machine1, samples, window_us)
+                clocks2, valid2 = self._nearest_clocks(machine2, samples, window_us)
+                both = valid1 & valid2
+                drifts = np.abs(clocks1[both] - clocks2[both])
+
+                if len(drifts):
                     print(f"Drift between Machine {machine1} and Machine {machine2}:")
-                    print(f"  Average drift: {avg_drift:.2f}")
-                    print(f"  Maximum drift: {max_drift}")
-                    print(f"  Minimum drift: {min_drift}")
+                    print(f"  Average drift: {drifts.mean():.2f}")
+                    print(f"  Maximum drift: {drifts.max()}")
+                    print(f"  Minimum drift: {drifts.min()}")
                     print(f"  Number of comparison points: {len(drifts)}")
                     print()
     
     def analyze_queue_lengths(self):
         """Analyze message queue lengths."""
         print("\n=== Message Queue Analysis ===")
-        for machine_id, queue_data in self.queue_lengths.items():
-            if queue_data:
-                queue_lengths = [length for _, length in queue_data]
-                avg_length = sum(queue_lengths) / len(queue_lengths)
-                max_length = max(queue_lengths)
+        for machine_id, (_, lengths) in self.queue_lengths.items():
+            if len(lengths):
+                counts = Counter(lengths.tolist())
                 print(f"Machine {machine_id}:")
-                print(f"  Average queue length: {avg_length:.2f}")
-                print(f"  Maximum queue length: {max_length}")
-                print(f"  Queue length distribution: {Counter(queue_lengths).most_common(5)}")
+                print(f"  Average queue length: {lengths.mean():.2f}")
+                print(f"  Maximum queue length: {lengths.max()}")
+                print(f"  Queue length distribution: {counts.most_common(5)}")
                 print()
     
     def analyze_event_distribution(self):
         """Analyze the distribution of event types."""
         print("\n=== Event Type Distribution ===")
         for machine_id, events in self.events.items():
-            event_types = [e['type'] for e in events]
-            event_counts = Counter(event_types)
-            total_events = len(event_types)
-            
+            types = events['type']
+            total_events = len(types)
+            counts = np.bincount(types, minlength=len(_EVENT_NAMES))
+
             print(f"Machine {machine_id}:")
-            for event_type, count in event_counts.items():
+            # Report the present types in order of first occurrence, as the
+            # old Counter over the event list did.
+            present = np.nonzero(counts)[0]
+            first_seen = [int(np.argmax(types == code)) for code in present]
+            for code in present[np.argsort(first_seen)]:
+                count = int(counts[code])
                 percentage = (count / total_events) * 100
-                print(f"  {event_type}: {count} ({percentage:.2f}%)")
+                print(f"  {_EVENT_NAMES[code]}: {count} ({percentage:.2f}%)")
             print(f"  Total events: {total_events}")
             print()
     
@@ -249,20 +420,17 @@ class LogAnalyzer:
         """Analyze how fast logical clocks progress relative to system time."""
         print("\n=== Logical Clock Progress Rate Analysis ===")
         
-        for machine_id, clock_data in self.logical_clocks.items():
-            if len(clock_data) < 2:
+        for machine_id, events in self.events.items():
+            if len(events['ts']) < 2:
                 continue
-                
-            # Sort by system timestamp
-            clock_data_sorted = sorted(clock_data)
-            
-            # Calculate clock rate (logical ticks per second of system time)
-            start_time, start_clock = clock_data_sorted[0]
-            end_time, end_clock = clock_data_sorted[-1]
-            
-            time_diff = (end_time - start_time).total_seconds()
-            clock_diff = end_clock - start_clock
-            
+
+            # The event columns are already chronologically sorted, so the
+            # rate reduces to the first and last entries of each column.
+            ts = events['ts']
+            clocks = events['clock']
+            time_diff = (ts[-1] - ts[0]) / 1e6
+            clock_diff = int(clocks[-1] - clocks[0])
+
             if time_diff > 0:
                 rate = clock_diff / time_diff
                 print(f"Machine {machine_id}:")
@@ -274,8 +442,14 @@ class LogAnalyzer:
     def analyze_communication_pattern(self):
         """Analyze the communication patterns between machines."""
         print("\n=== Communication Pattern Analysis ===")
-        
-        for sender_id, receivers in self.communication.items():
+
+        # Regroup the flat (sender, receiver) counter into a per-sender view
+        # just for printing; insertion order keeps the original grouping.
+        per_sender = defaultdict(dict)
+        for (sender_id, receiver_id), count in self.communication.items():
+            per_sender[sender_id][receiver_id] = count
+
+        for sender_id, receivers in per_sender.items():
             print(f"Machine {sender_id} sent messages to:")
             total_sent = sum(receivers.values())
             for receiver_id, count in receivers.items():
@@ -285,30 +459,41 @@ class LogAnalyzer:
     
     def plot_logical_clocks(self, save_path=None):
         """Plot logical clock values over time for all machines."""
+        # matplotlib is imported lazily: the analysis passes never need it,
+        # so text-only runs skip its considerable import cost.
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+
         plt.figure(figsize=(12, 8))
-        
-        for machine_id, clock_data in self.logical_clocks.items():
-            if not clock_data:
-                continue
-                
-            # Sort by timestamp
-            clock_data = sorted(clock_data)
-            timestamps, clock_values = zip(*clock_data)
-            
-            # Convert timestamps to seconds from start
-            all_start_times = [min(ts for ts, _ in data) for machine_id, data in self.logical_clocks.items() if data]
-            if not all_start_times:
-                continue
-                
-            start_time = min(all_start_times)
-            seconds = [(ts - start_time).total_seconds() for ts in timestamps]
-            
-            plt.plot(seconds, clock_values, label=f"Machine {machine_id}")
-        
+        ax = plt.gca()
+
+        # Reuse the sorted index arrays built after parsing: the series are
+        # already in chronological order, so the offset-from-start conversion
+        # is one vectorized subtraction per machine.
+        if self._sorted_ts:
+            start_us = min(ts[0] for ts in self._sorted_ts.values())
+
+        # All series go into one LineCollection instead of per-machine
+        # plt.plot calls: a single artist, with the default color cycle
+        # applied manually and proxy handles for the legend.
+        cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        segments = []
+        handles = []
+        for i, (machine_id, ts) in enumerate(self._sorted_ts.items()):
+            seconds = (ts - start_us) / 1e6
+            segments.append(np.column_stack((seconds, self._sorted_clk[machine_id])))
+            color = cycle[i % len(cycle)]
+            handles.append(Line2D([], [], color=color, label=f"Machine {machine_id}"))
+
+        if segments:
+            ax.add_collection(LineCollection(segments, colors=[h.get_color() for h in handles]))
+            ax.autoscale()
+
         plt.xlabel("Time (seconds)")
         plt.ylabel("Logical Clock Value")
         plt.title("Logical Clock Values Over Time")
-        plt.legend()
+        plt.legend(handles=handles)
         plt.grid(True)
         
         if save_path:
@@ -318,29 +503,24 @@ class LogAnalyzer:
     
     def plot_queue_lengths(self, save_path=None):
         """Plot message queue lengths over time for all machines."""
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 8))
         
-        for machine_id, queue_data in self.queue_lengths.items():
-            if not queue_data:
-                continue
-                
-            # Sort by timestamp
-            queue_data = sorted(queue_data)
-            timestamps, lengths = zip(*queue_data)
-            
-            # Convert timestamps to seconds from start
-            all_start_times = []
-            for m_id, data in self.queue_lengths.items():
-                if data:
-                    all_start_times.append(min(ts for ts, _ in data))
-            
-            if not all_start_times:
+        # Global start time, computed once rather than per machine.
+        all_start_times = [ts.min() for ts, _ in self.queue_lengths.values() if len(ts)]
+        if all_start_times:
+            start_us = min(all_start_times)
+
+        for machine_id, (ts, lengths) in self.queue_lengths.items():
+            if not len(ts):
                 continue
-                
-            start_time = min(all_start_times)
-            seconds = [(ts - start_time).total_seconds() for ts in timestamps]
-            
-            plt.plot(seconds, lengths, label=f"Machine {machine_id}")
+
+            # Sort by timestamp and convert to seconds from start.
+            order = np.argsort(ts, kind='stable')
+            seconds = (ts[order] - start_us) / 1e6
+
+            plt.plot(seconds, lengths[order], label=f"Machine {machine_id}")
         
         plt.xlabel("Time (seconds)")
         plt.ylabel("Queue Length")
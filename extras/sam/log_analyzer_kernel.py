@@ -0,0 +1,52 @@
+"""
+Numba kernels for the log analyzer's integer array math.
+
+Both kernels operate on the int64 columns produced by the parse step. The
+module is an optional dependency of log_analyzer: when numba is not
+installed the analyzer falls back to its NumPy implementations.
+"""
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def positive_jumps(clocks, out_jumps, out_bad):
+    """Computes consecutive clock differences in one native pass.
+
+    Positive differences go to out_jumps and the indices of non-positive
+    differences to out_bad (both sized len(clocks) - 1 by the caller).
+    Returns (n_jumps, n_bad).
+    """
+    n_jumps = 0
+    n_bad = 0
+    for i in range(clocks.shape[0] - 1):
+        jump = clocks[i + 1] - clocks[i]
+        if jump > 0:
+            out_jumps[n_jumps] = jump
+            n_jumps += 1
+        else:
+            out_bad[n_bad] = i
+            n_bad += 1
+    return n_jumps, n_bad
+
+@njit(cache=True)
+def nearest_clocks(ts, clk, samples, window, out_clk, out_valid):
+    """Nearest-entry lookup for every sample via a two-pointer merge.
+
+    ts and samples are both sorted ascending, so one forward sweep visits
+    each array once instead of a binary search per sample. The earlier entry
+    wins ties, matching the NumPy fallback. out_clk receives the nearest
+    clock value and out_valid whether its distance is inside the window.
+    """
+    n = ts.shape[0]
+    j = 0
+    for i in range(samples.shape[0]):
+        s = samples[i]
+        while j + 1 < n and ts[j + 1] <= s:
+            j += 1
+        best = j
+        diff = abs(s - ts[j])
+        if j + 1 < n and abs(ts[j + 1] - s) < diff:
+            best = j + 1
+            diff = abs(ts[j + 1] - s)
+        out_clk[i] = clk[best]
+        out_valid[i] = diff < window
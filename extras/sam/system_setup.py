@@ -1,13 +1,29 @@
 import random
 import time
-import multiprocessing
 import subprocess
 import os
 import sys
-from virtual_machine import VirtualMachine
 
-def run_machine(machine_id, clock_rate, port, other_machines, duration, internal_prob):
-    """Function to run in a separate process for each virtual machine."""
+def run_machine(argv):
+    """CLI entry point for one virtual machine process.
+
+    argv is [machine_id, clock_rate, port, duration, internal_prob,
+    host:port...]. Each machine runs as a fresh `python system_setup.py
+    --run-machine ...` subprocess rather than a multiprocessing.Process:
+    the child starts from a clean interpreter (no gRPC state inherited
+    across a fork) and the parent never has to import grpc at all."""
+    from virtual_machine import VirtualMachine
+
+    machine_id = int(argv[0])
+    clock_rate = int(argv[1])
+    port = int(argv[2])
+    duration = int(argv[3])
+    internal_prob = float(argv[4])
+    other_machines = []
+    for spec in argv[5:]:
+        host, _, peer_port = spec.partition(':')
+        other_machines.append((host, int(peer_port)))
+
     vm = VirtualMachine(machine_id, clock_rate, port, other_machines, internal_prob)
     print(f"Starting Machine {machine_id} with clock rate {clock_rate} ticks/sec, internal probability {internal_prob}")
     vm.run(duration)
@@ -43,27 +59,26 @@ def setup_system(num_machines=3, duration_seconds=60, min_clock_rate=1, max_cloc
                 others.append(('localhost', ports[j]))
         other_machines_list.append(others)
     
-    # Create processes for each machine
+    # Launch one subprocess per machine through the --run-machine entry point.
+    script = os.path.abspath(__file__)
     processes = []
     for i in range(num_machines):
-        p = multiprocessing.Process(
-            target=run_machine, 
-            args=(i+1, clock_rates[i], ports[i], other_machines_list[i], duration_seconds, internal_prob)
-        )
-        processes.append(p)
-    
-    # Start all processes
-    for p in processes:
-        p.start()
-        # Small delay to ensure machines start up in order
-        time.sleep(0.5)
-    
+        cmd = [sys.executable, script, '--run-machine',
+               str(i + 1), str(clock_rates[i]), str(ports[i]),
+               str(duration_seconds), str(internal_prob)]
+        cmd += [f"{host}:{port}" for host, port in other_machines_list[i]]
+        # No stagger between launches: every machine already waits two
+        # seconds after starting its server before connecting to peers, so
+        # back-to-back starts leave plenty of margin and the machines begin
+        # (and end) their runs together.
+        processes.append(subprocess.Popen(cmd, start_new_session=True))
+
     print(f"All machines started. Running for {duration_seconds} seconds...")
-    
+
     # Wait for all processes to finish
     for p in processes:
-        p.join()
-    
+        p.wait()
+
     print("All machines have completed their runs.")
 
 def run_experiments():
@@ -101,6 +116,9 @@ package distributed_clock;
 service ClockService {
   // Send a message containing logical clock time
   rpc SendMessage (ClockMessage) returns (ClockResponse) {}
+
+  // Stream clock messages over one long-lived call
+  rpc SendClockStream (stream ClockMessage) returns (ClockResponse) {}
 }
 
 // Message containing logical clock time
@@ -116,6 +134,15 @@ message ClockResponse {
 }
 """)
         
+        # Skip regeneration when the generated modules already exist and are
+        # newer than the proto definition (classic timestamp check); protoc
+        # costs a second or two on every run otherwise.
+        outputs = ('clock_pb2.py', 'clock_pb2_grpc.py')
+        if all(os.path.exists(out) for out in outputs):
+            if min(os.path.getmtime(out) for out in outputs) >= os.path.getmtime('clock.proto'):
+                print("gRPC code is up to date; skipping generation.")
+                return True
+
         # Generate Python code from the proto file
         print("Generating gRPC code from proto file...")
         subprocess.check_call([
@@ -130,6 +157,11 @@ message ClockResponse {
         return False
 
 if __name__ == "__main__":
+    # Child-process entry point used by setup_system.
+    if len(sys.argv) > 1 and sys.argv[1] == '--run-machine':
+        run_machine(sys.argv[2:])
+        sys.exit(0)
+
     # Generate the gRPC code before running experiments
     if generate_proto_code():
         run_experiments()
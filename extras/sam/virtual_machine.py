@@ -3,15 +3,68 @@ import time
 import random
 import queue
 import logging
+import logging.handlers
 import threading
 import datetime
 import concurrent.futures
+from collections import deque
 from datetime import datetime
 
 # Import the generated gRPC code
 import clock_pb2
 import clock_pb2_grpc
 
+# Sentinel pushed onto a stream writer's queue to close its stream.
+_STREAM_STOP = object()
+
+class _StreamWriter:
+    """Feeds one long-lived client-streaming RPC to a peer machine.
+
+    The clock loop pushes messages onto an internal queue; a background
+    thread owns the SendClockStream call and yields them into the stream.
+    A send therefore costs one queue put instead of a full unary round trip
+    (HTTP/2 headers, data and trailers per message)."""
+
+    def __init__(self, target, stub):
+        self.target = target
+        self._stub = stub
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def send(self, message):
+        """Queue one message for the stream; never blocks the caller."""
+        self._queue.put(message)
+
+    def close(self):
+        """End the stream and wait briefly for the writer thread."""
+        self._queue.put(_STREAM_STOP)
+        self._thread.join(timeout=5)
+
+    def _messages(self, first):
+        """Generator the gRPC call consumes: the pending message, then
+        everything queued until the stop sentinel arrives."""
+        yield first
+        while True:
+            item = self._queue.get()
+            if item is _STREAM_STOP:
+                self._closed = True
+                return
+            yield item
+
+    def _run(self):
+        # Open the stream lazily, only once there is a message to carry, and
+        # reopen it on the next message after a connection-level failure.
+        while not self._closed:
+            first = self._queue.get()
+            if first is _STREAM_STOP:
+                return
+            try:
+                self._stub.SendClockStream(self._messages(first))
+            except grpc.RpcError as e:
+                print(f"Stream to {self.target} failed: {e.code()}")
+
 class ClockServicer(clock_pb2_grpc.ClockServiceServicer):
     """Implements the ClockService service."""
     
@@ -24,12 +77,20 @@ class ClockServicer(clock_pb2_grpc.ClockServiceServicer):
         sender_id = request.sender_id
         logical_clock = request.logical_clock
         
-        # Add to message queue
-        self.vm.message_queue.put((sender_id, logical_clock))
+        # Add to message queue (deque.append is atomic in CPython, so the
+        # gRPC worker and the clock loop need no lock around it)
+        self.vm.message_queue.append((sender_id, logical_clock))
         
         # Return acknowledgment
         return clock_pb2.ClockResponse(received=True)
 
+    def SendClockStream(self, request_iterator, context):
+        """Receive a stream of messages from another machine."""
+        append = self.vm.message_queue.append
+        for request in request_iterator:
+            append((request.sender_id, request.logical_clock))
+        return clock_pb2.ClockResponse(received=True)
+
 class VirtualMachine:
     def __init__(self, machine_id, clock_rate, port, other_machines=None, internal_prob=0.7):
         """
@@ -46,7 +107,7 @@ class VirtualMachine:
         self.clock_rate = clock_rate  # Ticks per second
         self.port = port
         self.host = 'localhost'
-        self.other_machines = other_machines if other_machines else []
+        self.other_machines = tuple(other_machines) if other_machines else ()
         self.internal_prob = internal_prob
         
         # Calculate action thresholds based on internal_prob
@@ -57,95 +118,204 @@ class VirtualMachine:
         # Initialize logical clock
         self.logical_clock = 0
         
-        # Initialize message queue
-        self.message_queue = queue.Queue()
+        # Initialize message queue (lock-free under the GIL)
+        self.message_queue = deque()
+
+        # Batched RNG draws: random.randint and random.choice cost a
+        # surprising amount of pure-Python work per call, so actions and peer
+        # picks are drawn 1024 at a time and handed out from index pointers.
+        self._event_pool = []
+        self._event_idx = 0
+        self._peer_pool = []
+        self._peer_idx = 0
         
-        # Create gRPC server
-        self.server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=10))
+        # Create gRPC server. One worker per peer is enough: each peer holds
+        # a single long-lived inbound stream whose handler only enqueues
+        # messages, and extra idle threads would just contend for the GIL
+        # with the clock loop.
+        workers = max(1, len(self.other_machines))
+        self.server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=workers))
         self.servicer = ClockServicer(self)
         clock_pb2_grpc.add_ClockServiceServicer_to_server(self.servicer, self.server)
         self.server.add_insecure_port(f"{self.host}:{self.port}")
         
         # Initialize clients for other machines
+        self.channels = {}  # Persistent gRPC channels, one per machine
         self.stubs = {}  # Will hold gRPC stubs for other machines
+        self._writers = {}  # One long-lived stream writer per machine
         
-        # Set up logging
+        # Set up logging. Records go through an in-memory queue drained by a
+        # listener thread that owns the file handler, so the clock loop never
+        # blocks on disk I/O for a log line.
         log_filename = f"machine_{machine_id}.log"
-        logging.basicConfig(
-            filename=log_filename,
-            level=logging.INFO,
-            format='%(asctime)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S.%f'
-        )
+        formatter = logging.Formatter('%(asctime)s - %(message)s',
+                                      datefmt='%Y-%m-%d %H:%M:%S.%f')
+        file_handler = logging.FileHandler(log_filename, delay=True)
+        file_handler.setFormatter(formatter)
+        log_queue = queue.SimpleQueue()
         self.logger = logging.getLogger(f"Machine_{machine_id}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
         
         # Flag to control the machine's operation
         self.running = False
     
     def connect_to_other_machines(self):
-        """Establish connections to other virtual machines."""
+        """Establish connections to other virtual machines.
+
+        One channel per peer, created once and reused for every RPC, with
+        keepalive pings so the connection stays warm across idle spells."""
+        options = [
+            ('grpc.keepalive_time_ms', 30000),
+            ('grpc.max_concurrent_streams', 1000),
+        ]
         for host, port in self.other_machines:
-            channel = grpc.insecure_channel(f"{host}:{port}")
+            channel = grpc.insecure_channel(f"{host}:{port}", options=options)
+            self.channels[(host, port)] = channel
             stub = clock_pb2_grpc.ClockServiceStub(channel)
             self.stubs[(host, port)] = stub
+            self._writers[(host, port)] = _StreamWriter((host, port), stub)
             print(f"Machine {self.machine_id} connected to {host}:{port}")
     
-    def send_message(self, target_machine):
+    def send_message(self, target_machine, system_time=None):
         """
         Send a message containing the local logical clock time to a target machine.
-        
+
+        The message goes onto the target's stream writer queue and rides the
+        long-lived SendClockStream call, so the clock loop never waits on a
+        per-message round trip. A fresh message is built per send because the
+        writer thread serializes it after this method returns.
+
         Args:
             target_machine (tuple): (host, port) of the target machine
+            system_time (datetime): Timestamp for the log entry; defaults to
+                now. process_cycle passes its per-cycle reading so one cycle
+                costs one clock read.
         """
         try:
             # Update logical clock for send event
             self.logical_clock += 1
-            
-            # Create timestamp for logging
-            system_time = datetime.now()
-            timestamp_str = system_time.strftime("%Y-%m-%d %H:%M:%S.%f")
-            
-            # Create and send message
+
+            # Timestamp for logging. The wire timestamp is a plain nanosecond
+            # count: nothing on the receive side parses it, and str() of an
+            # int is far cheaper than strftime on every send.
+            if system_time is None:
+                system_time = datetime.now()
+
             message = clock_pb2.ClockMessage(
                 sender_id=self.machine_id,
                 logical_clock=self.logical_clock,
-                timestamp=timestamp_str
+                timestamp=str(time.time_ns())
             )
-            
-            # Send the message using gRPC stub
-            response = self.stubs[target_machine].SendMessage(message)
-            
-            # Log the send event
+            self._writers[target_machine].send(message)
+
+            # Log the send event (%-style args defer the string formatting
+            # to the listener thread)
             self.logger.info(
-                f"SEND - System Time: {system_time}, " +
-                f"Logical Clock: {self.logical_clock}, " +
-                f"Destination: Machine at {target_machine}"
+                "SEND - System Time: %s, Logical Clock: %d, "
+                "Destination: Machine at %s",
+                system_time, self.logical_clock, target_machine
             )
         except Exception as e:
             print(f"Error sending message to {target_machine}: {e}")
-    
-    def process_cycle(self):
-        """Process one clock cycle according to the rules."""
-        # Check if there's a message in the queue
-        if not self.message_queue.empty():
-            # Process one message
-            sender_id, received_clock = self.message_queue.get()
-            
-            # Update logical clock according to Lamport's rule
-            self.logical_clock = max(self.logical_clock, received_clock) + 1
-            
-            # Log the receive event
+
+    def broadcast_message(self, targets, system_time=None):
+        """
+        Send a message to every target machine concurrently.
+
+        Each send is still its own Lamport event (the logical clock ticks per
+        target), but each message just joins its target's stream writer
+        queue, so the whole broadcast costs a handful of queue puts on the
+        clock loop.
+
+        Args:
+            targets (tuple): (host, port) tuples of the target machines
+            system_time (datetime): Timestamp shared by every send's log
+                entry; defaults to now.
+        """
+        if system_time is None:
             system_time = datetime.now()
-            queue_length = self.message_queue.qsize()
+        for target in targets:
+            self.logical_clock += 1
+            message = clock_pb2.ClockMessage(
+                sender_id=self.machine_id,
+                logical_clock=self.logical_clock,
+                timestamp=str(time.time_ns())
+            )
+            try:
+                self._writers[target].send(message)
+            except Exception as e:
+                print(f"Error sending message to {target}: {e}")
+                continue
             self.logger.info(
-                f"RECEIVE - System Time: {system_time}, " +
-                f"Queue Length: {queue_length}, " +
-                f"Logical Clock: {self.logical_clock}, " +
-                f"From: Machine {sender_id}"
+                "SEND - System Time: %s, Logical Clock: %d, "
+                "Destination: Machine at %s",
+                system_time, self.logical_clock, target
             )
+
+    def _next_event(self):
+        """Return the next random action in [1, 10], refilling the batch of
+        draws when it is exhausted."""
+        if self._event_idx == len(self._event_pool):
+            self._event_pool = random.choices(range(1, 11), k=1024)
+            self._event_idx = 0
+        event = self._event_pool[self._event_idx]
+        self._event_idx += 1
+        return event
+
+    def _choose_peer(self):
+        """Return a uniformly random peer machine from the batched picks."""
+        if self._peer_idx == len(self._peer_pool):
+            self._peer_pool = random.choices(self.other_machines, k=1024)
+            self._peer_idx = 0
+        peer = self._peer_pool[self._peer_idx]
+        self._peer_idx += 1
+        return peer
+
+    def process_cycle(self):
+        """Process one clock cycle according to the rules."""
+        # Hoist the hot attributes into locals: this method runs clock_rate
+        # times per second and local loads are several times cheaper than
+        # attribute lookups in CPython.
+        message_queue = self.message_queue
+        logger_info = self.logger.info
+
+        # One system-time read per cycle, shared by every event logged below.
+        system_time = datetime.now()
+
+        # Check if there's a message in the queue
+        if message_queue:
+            # Drain up to a small burst of messages this cycle so arrival
+            # spikes cannot grow the queue faster than one-per-cycle service
+            # drains it. Each message keeps its own RECEIVE line because the
+            # log analyzer consumes them individually. EAFP inside the loop:
+            # popleft and catch IndexError at the end of the burst rather
+            # than re-checking the deque per message.
+            drained = 0
+            logical_clock = self.logical_clock
+            while drained < 8:
+                try:
+                    sender_id, received_clock = message_queue.popleft()
+                except IndexError:
+                    break
+
+                # Update logical clock according to Lamport's rule
+                logical_clock = max(logical_clock, received_clock) + 1
+
+                # Log the receive event
+                logger_info(
+                    "RECEIVE - System Time: %s, Queue Length: %d, "
+                    "Logical Clock: %d, From: Machine %d",
+                    system_time, len(message_queue), logical_clock, sender_id
+                )
+                drained += 1
+            self.logical_clock = logical_clock
         else:
             # No message, generate random action (adjusted for internal_prob)
-            action = random.randint(1, 10)
+            action = self._next_event()
             
             # Remap actions based on internal_prob
             # Lower action_threshold means more communication events
@@ -155,31 +325,31 @@ class VirtualMachine:
                 
                 if comm_type == 1:
                     # Send to one random machine
-                    target = random.choice(self.other_machines)
-                    self.send_message(target)
+                    target = self._choose_peer()
+                    self.send_message(target, system_time)
                     
                 elif comm_type == 2 and len(self.other_machines) > 0:
-                    # Send to another random machine (different from the first if possible)
+                    # Send to another random machine (different from the first
+                    # if possible). Index into the tuple directly rather than
+                    # building a filtered list on every event.
                     if len(self.other_machines) > 1:
-                        # Choose a different machine
-                        target = random.choice([m for m in self.other_machines if m != self.other_machines[0]])
+                        target = self.other_machines[random.randrange(1, len(self.other_machines))]
                     else:
                         target = self.other_machines[0]
-                    self.send_message(target)
+                    self.send_message(target, system_time)
                     
                 elif comm_type == 3:
-                    # Send to all other machines
-                    for machine in self.other_machines:
-                        self.send_message(machine)
+                    # Send to all other machines, with the RPCs in flight
+                    # concurrently.
+                    self.broadcast_message(self.other_machines, system_time)
             else:
                 # Internal event
                 self.logical_clock += 1
-                
+
                 # Log the internal event
-                system_time = datetime.now()
-                self.logger.info(
-                    f"INTERNAL - System Time: {system_time}, " +
-                    f"Logical Clock: {self.logical_clock}"
+                logger_info(
+                    "INTERNAL - System Time: %s, Logical Clock: %d",
+                    system_time, self.logical_clock
                 )
     
     def run(self, duration_seconds=60):
@@ -201,15 +371,23 @@ class VirtualMachine:
         # Connect to other machines
         self.connect_to_other_machines()
         
-        # Calculate sleep time based on clock rate
-        sleep_time = 1.0 / self.clock_rate
-        
-        # Run for the specified duration
-        start_time = time.time()
+        # Tick on absolute deadlines from the monotonic clock: each deadline
+        # advances by one fixed period, so per-cycle processing cost does not
+        # accumulate drift and wall-clock adjustments cannot stretch the run.
+        period = 1.0 / self.clock_rate
+        process_cycle = self.process_cycle
+        monotonic = time.monotonic
+        sleep = time.sleep
+        start_time = monotonic()
+        end_time = start_time + duration_seconds
+        next_tick = start_time + period
         try:
-            while time.time() - start_time < duration_seconds:
-                self.process_cycle()
-                time.sleep(sleep_time)
+            while monotonic() < end_time:
+                process_cycle()
+                now = monotonic()
+                if now < next_tick:
+                    sleep(next_tick - now)
+                next_tick += period
         except KeyboardInterrupt:
             print(f"Machine {self.machine_id} stopped by user.")
         finally:
@@ -218,6 +396,13 @@ class VirtualMachine:
     
     def cleanup(self):
         """Clean up resources when shutting down."""
-        # Shut down the gRPC server
+        # End the outbound streams, close the peer channels, then shut down
+        # the gRPC server
+        for writer in self._writers.values():
+            writer.close()
+        for channel in self.channels.values():
+            channel.close()
         self.server.stop(0)
+        # Drain any queued log records before the process exits
+        self._log_listener.stop()
         print(f"Machine {self.machine_id} shut down.")
\ No newline at end of file
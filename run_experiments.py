@@ -2,6 +2,7 @@ import subprocess
 import time
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 
 # Number of experiment runs and duration (in seconds) per run.
 NUM_RUNS = 5
@@ -12,24 +13,44 @@ EXPERIMENT_MIN_TICKS = 2  # Minimum ticks per second for the experiment
 EXPERIMENT_MAX_TICKS = 3  # Maximum ticks per second for the experiment
 EXPERIMENT_TIGHT = False   # Enable tight mode (smaller probability of internal events)
 
-# Configuration for the three virtual machines.
-# Each tuple: (machine_id, port, comma-separated peer addresses)
-VM_CONFIGS = [
-    ('machine1', '50051', 'localhost:50052,localhost:50053,localhost:50054'),
-    ('machine2', '50052', 'localhost:50051,localhost:50053,localhost:50054'),
-    ('machine3', '50053', 'localhost:50051,localhost:50052,localhost:50054'),
-    ('machine4', '50054', 'localhost:50051,localhost:50052,localhost:50053'),
-]
+# Base port for the default configuration; concurrent runs use disjoint
+# ten-port ranges above this so their VMs never collide.
+BASE_PORT = 50050
 
-def run_experiment():
-    """Launches the three VM processes with the modified tick rate and tight mode parameters,
-    lets them run for RUN_DURATION seconds, then terminates the processes."""
+# Absolute path to the VM script so it can be launched from any working directory.
+VM_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'virtual_machine.py')
+
+def make_vm_configs(base_port):
+    """Builds the four VM configurations for a run rooted at base_port.
+
+    Returns a list of (machine_id, port, comma-separated peer addresses)
+    tuples, with each machine peered to the other three."""
+    ports = [base_port + i for i in range(1, 5)]
+    configs = []
+    for i, port in enumerate(ports):
+        peers = ",".join(f"localhost:{p}" for p in ports if p != port)
+        configs.append((f"machine{i + 1}", str(port), peers))
+    return configs
+
+# Default configuration for the four virtual machines (ports 50051-50054).
+VM_CONFIGS = make_vm_configs(BASE_PORT)
+
+def run_experiment(run_number, base_port=BASE_PORT):
+    """Launches the four VM processes for one run with the configured tick
+    rate and tight mode parameters, lets them run for RUN_DURATION seconds,
+    then terminates the processes.
+
+    Each run writes its logs into its own experiment_run_<n> directory (the
+    VMs run with that directory as their working directory), so several runs
+    can execute concurrently on disjoint port ranges."""
+    run_dir = f"experiment_run_{run_number}"
+    os.makedirs(run_dir, exist_ok=True)
     processes = []
 
     # Launch each VM as a subprocess.
-    for machine_id, port, peers in VM_CONFIGS:
+    for machine_id, port, peers in make_vm_configs(base_port):
         cmd = [
-            'python', 'virtual_machine.py', machine_id, port, peers,
+            'python', VM_SCRIPT, machine_id, port, peers,
             '--min-ticks', str(EXPERIMENT_MIN_TICKS),
             '--max-ticks', str(EXPERIMENT_MAX_TICKS)
         ]
@@ -37,21 +58,26 @@ def run_experiment():
             cmd.append('--tight')
         print(f"Starting {machine_id} on port {port} with peers {peers}")
         print("Command:", " ".join(cmd))
-        proc = subprocess.Popen(cmd)
+        # Drop the VMs' console output at the OS level: the log files carry
+        # the events, and a shared terminal would serialize the writes.
+        proc = subprocess.Popen(cmd, cwd=run_dir,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         processes.append(proc)
 
     # Let the VMs run for the specified duration.
     time.sleep(RUN_DURATION)
 
     # Terminate all VM processes.
-    print("Terminating VM processes for this run...")
+    print(f"Terminating VM processes for run {run_number}...")
     for proc in processes:
         proc.terminate()
     # Allow a few seconds for clean termination.
     time.sleep(5)
+    return run_number
 
 def collect_logs(run_number):
-    """Moves log files into a directory specific to the current run."""
+    """Moves any log files left in the current directory into the directory
+    for the given run (VMs normally write there directly already)."""
     run_dir = f"experiment_run_{run_number}"
     os.makedirs(run_dir, exist_ok=True)
 
@@ -65,13 +91,15 @@ def collect_logs(run_number):
 if __name__ == "__main__":
     print("Experiment parameters:")
     print("  Run duration:", RUN_DURATION, "seconds per run")
-    print("  Number of runs:", NUM_RUNS)
+    print("  Number of runs:", NUM_RUNS, "(executed concurrently)")
     print("  Tick rate range:", EXPERIMENT_MIN_TICKS, "to", EXPERIMENT_MAX_TICKS, "ticks per second")
     print("  Tight mode:", "Enabled" if EXPERIMENT_TIGHT else "Disabled")
-    for run in range(1, NUM_RUNS + 1):
-        print(f"\n=== Starting Experiment Run {run} ===")
-        run_experiment()
-        collect_logs(run)
-        print(f"=== Experiment Run {run} Complete ===\n")
-        # Optionally, pause between runs.
-        time.sleep(10)
\ No newline at end of file
+    # Run all experiments concurrently: each run gets a disjoint port range
+    # and its own log directory, so total wall time is one run, not five.
+    with ProcessPoolExecutor(max_workers=NUM_RUNS) as executor:
+        futures = [executor.submit(run_experiment, run, BASE_PORT + 10 * (run - 1))
+                   for run in range(1, NUM_RUNS + 1)]
+        for future in futures:
+            run = future.result()
+            collect_logs(run)
+            print(f"=== Experiment Run {run} Complete ===")
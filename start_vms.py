@@ -0,0 +1,63 @@
+"""
+Single-host benchmark launcher that runs all virtual machines inside one
+interpreter.
+
+Launching each VM as a `python virtual_machine.py ...` subprocess pays
+interpreter startup and module import three to four times over. For
+single-host runs the VirtualMachine objects can instead share one process,
+each driving its simulation loop on its own thread while still exercising
+the real gRPC path over localhost.
+"""
+import threading
+
+from virtual_machine import VirtualMachine
+
+# Duration of the run in seconds.
+RUN_DURATION = 60
+
+# Transport for inter-machine RPCs: 'tcp' dials localhost ports, 'uds'
+# dials Unix domain sockets, which skip the kernel TCP stack on loopback
+# and cut small-message latency (see VirtualMachine.start_server).
+TRANSPORT = 'tcp'
+
+# Configuration for the four virtual machines.
+# Each tuple: (machine_id, port, comma-separated peer addresses)
+VM_CONFIGS = [
+    ('machine1', 50051, 'localhost:50052,localhost:50053,localhost:50054'),
+    ('machine2', 50052, 'localhost:50051,localhost:50053,localhost:50054'),
+    ('machine3', 50053, 'localhost:50051,localhost:50052,localhost:50054'),
+    ('machine4', 50054, 'localhost:50051,localhost:50052,localhost:50053'),
+]
+
+def _vm_configs():
+    """Returns VM_CONFIGS, rewritten to unix: socket peers under uds."""
+    if TRANSPORT == 'uds':
+        return [(machine_id, port,
+                 ','.join(f'unix:/tmp/vm_{other}.sock'
+                          for other, _, _ in VM_CONFIGS if other != machine_id))
+                for machine_id, port, _ in VM_CONFIGS]
+    return VM_CONFIGS
+
+def main():
+    vms = [VirtualMachine(machine_id, port, peers.split(','))
+           for machine_id, port, peers in _vm_configs()]
+
+    # Bring every server up before any simulation loop starts sending.
+    for vm in vms:
+        vm.start_server()
+
+    run_threads = [threading.Thread(target=vm.run, kwargs={'duration': RUN_DURATION})
+                   for vm in vms]
+    for thread in run_threads:
+        thread.start()
+
+    try:
+        for thread in run_threads:
+            thread.join()
+    finally:
+        for vm in vms:
+            vm.stop_server()
+        print("All servers stopped")
+
+if __name__ == '__main__':
+    main()
@@ -40,7 +40,7 @@ class TestAnalyzeLogs(unittest.TestCase):
         events = process_log_file(self.log_file)
         jumps = compute_jumps(events)
         # Expected jumps: 2-1 = 1, 3-2 = 1, 4-3 = 1.
-        self.assertEqual(jumps, [1, 1, 1])
+        self.assertEqual(jumps.tolist(), [1, 1, 1])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
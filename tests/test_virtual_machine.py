@@ -10,7 +10,7 @@ sys.argv = ["dummy.py", "dummy", "50051", "localhost:50052,localhost:50053"]
 import unittest
 import tempfile
 import time
-import queue
+from collections import deque
 from unittest.mock import patch
 
 from virtual_machine import VirtualMachine, TIGHT_MODE
@@ -22,16 +22,16 @@ class DummyMessage:
         self.logical_clock = logical_clock
         self.system_time = system_time
 
-# Dummy logger to capture log messages.
+# Dummy logger to capture log messages (formats %-style lazy args like logging does).
 class DummyLogger:
     def __init__(self):
         self.messages = []
-    def info(self, msg):
-        self.messages.append(msg)
-    def error(self, msg):
-        self.messages.append(msg)
+    def info(self, msg, *args):
+        self.messages.append(msg % args if args else msg)
+    def error(self, msg, *args):
+        self.messages.append(msg % args if args else msg)
 
-# Generator function to simulate time.time() incrementing.
+# Generator function to simulate time.monotonic() incrementing.
 def time_generator(start=100.0, increment=0.5):
     t = start
     while True:
@@ -57,12 +57,12 @@ class TestVirtualMachine(unittest.TestCase):
 
     @patch("time.sleep", return_value=None)
     def test_message_processing(self, patched_sleep):
-        # Replace time.time with our generator to simulate controlled time increments.
+        # Replace time.monotonic with our generator to simulate controlled time increments.
         gen = time_generator(start=100.0, increment=0.5)
-        with patch("time.time", side_effect=lambda: next(gen)):
+        with patch("time.monotonic", side_effect=lambda: next(gen)):
             # Test that a message in the queue is processed correctly.
             dummy_msg = DummyMessage("other_vm", 10, 100)  # Dummy system_time of 100.
-            self.vm.message_queue.put(dummy_msg)
+            self.vm.message_queue.append(dummy_msg)
             self.vm.logical_clock = 5  # Set lower than dummy message's clock.
             self.vm.run(duration=1)
             # Expect the new clock to be max(5, 10) + 1 = 11.
@@ -75,7 +75,7 @@ class TestVirtualMachine(unittest.TestCase):
         original_tight = TIGHT_MODE
         TIGHT_MODE = True
         
-        self.vm.message_queue = queue.Queue()
+        self.vm.message_queue = deque()
         self.vm.logical_clock = 0
         
         # Run the simulation briefly.
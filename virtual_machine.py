@@ -1,39 +1,122 @@
 import grpc
 from concurrent import futures
+import numpy as np
+import os
 import time
 import threading
 import queue
 import random
+from collections import deque
 import sys
 import logging
+import logging.handlers
 import argparse
 
+# Prefer the native (upb) protobuf backend before any pb2 module is imported;
+# the pure-Python fallback encodes every field in bytecode and is several
+# times slower on the send path.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 # Import the generated gRPC classes (from machine.proto)
 import machine_pb2
 import machine_pb2_grpc
 
-# Parse command-line arguments.
-parser = argparse.ArgumentParser(
-    description="Run a virtual machine for the distributed system. "
-                "This program now supports configurations with 4 machines. "
-                "Provide a comma-separated list of peer addresses (e.g., "
-                "localhost:50052,localhost:50053,localhost:50054) for a 4-machine setup."
-)
-parser.add_argument("machine_id", type=str, help="Unique machine identifier")
-parser.add_argument("port", type=int, help="Port number for the gRPC server")
-parser.add_argument("peer_addresses", type=str,
-                    help="Comma-separated list of peer addresses (e.g., localhost:50052,localhost:50053,localhost:50054)")
-parser.add_argument("--tight", action="store_true",
-                    help="Enable tight mode (decreases the probability of internal events)")
-parser.add_argument("--min-ticks", type=int, default=1,
-                    help="Minimum clock ticks per second (default: 1)")
-parser.add_argument("--max-ticks", type=int, default=6,
-                    help="Maximum clock ticks per second (default: 6)")
-args = parser.parse_args()
-
-TIGHT_MODE = args.tight
-MIN_TICKS = args.min_ticks
-MAX_TICKS = args.max_ticks
+from google.protobuf.internal import api_implementation
+if api_implementation.Type() == "python":
+    print("Warning: pure-Python protobuf backend in use; install protobuf>=4 "
+          "with its native extension for faster message serialization.",
+          file=sys.stderr)
+
+# Runtime configuration; overridden from the command line when this module is
+# run as a script. Kept at module level so importers (tests, in-process
+# launchers such as start_vms.py) get the defaults without parsing arguments.
+TIGHT_MODE = False
+MIN_TICKS = 1
+MAX_TICKS = 6
+
+def parse_args(argv=None):
+    """Parses the command-line arguments for running a single virtual machine."""
+    parser = argparse.ArgumentParser(
+        description="Run a virtual machine for the distributed system. "
+                    "This program now supports configurations with 4 machines. "
+                    "Provide a comma-separated list of peer addresses (e.g., "
+                    "localhost:50052,localhost:50053,localhost:50054) for a 4-machine setup."
+    )
+    parser.add_argument("machine_id", type=str, help="Unique machine identifier")
+    parser.add_argument("port", type=int, help="Port number for the gRPC server")
+    parser.add_argument("peer_addresses", type=str,
+                        help="Comma-separated list of peer addresses (e.g., localhost:50052,localhost:50053,localhost:50054)")
+    parser.add_argument("--tight", action="store_true",
+                        help="Enable tight mode (decreases the probability of internal events)")
+    parser.add_argument("--min-ticks", type=int, default=1,
+                        help="Minimum clock ticks per second (default: 1)")
+    parser.add_argument("--max-ticks", type=int, default=6,
+                        help="Maximum clock ticks per second (default: 6)")
+    return parser.parse_args(argv)
+
+# Number of random draws generated per batch refill.
+RNG_BATCH_SIZE = 8192
+
+# Maximum number of queued messages drained in a single tick. Bounded so one
+# tick cannot monopolize the loop, but large enough that burst arrivals do not
+# outpace a one-per-tick consumer.
+RECEIVE_BURST = 8
+
+# Options applied to every peer channel: keepalive so the single long-lived
+# connection per peer survives idle spells, and headroom for concurrent
+# in-flight RPCs during broadcasts.
+_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.max_concurrent_streams', 1000),
+]
+
+# Process-wide server worker pool, created lazily. When several machines run
+# in one interpreter (start_vms.py, the tests) a pool per server multiplies
+# idle threads and kernel wakeups; grpc.server only borrows a worker while a
+# handler runs, so all servers can share one pool. Never shut down by
+# stop_server — it lives for the life of the process.
+_server_pool = None
+
+def _shared_server_pool():
+    """Returns the process-wide gRPC server thread pool, creating it on
+    first use."""
+    global _server_pool
+    if _server_pool is None:
+        _server_pool = futures.ThreadPoolExecutor(
+            max_workers=max(10, 4 * (os.cpu_count() or 1)),
+            thread_name_prefix='grpc-server')
+    return _server_pool
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler variant that batches write syscalls.
+
+    The stream is opened with a 64 KiB user-space buffer and the per-record
+    flush that StreamHandler.emit performs is rate-limited to once per
+    flush_interval seconds, so under high event rates the listener thread
+    issues a handful of large writes per second instead of one syscall per
+    record. close() still flushes unconditionally.
+    """
+    def __init__(self, filename, flush_interval=1.0, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16,
+                    encoding=self.encoding, errors=self.errors)
+
+    def flush(self):
+        # Called after every record; only pay the syscall once per interval.
+        # Handler shutdown bypasses this rate limit via close().
+        now = time.monotonic()
+        if now - self._last_flush >= self._flush_interval:
+            self._last_flush = now
+            super().flush()
+
+    def close(self):
+        self._last_flush = float('-inf')  # force the final flush through
+        super().close()
 
 class MachineServiceServicer(machine_pb2_grpc.MachineServiceServicer):
     """
@@ -47,7 +130,9 @@ class MachineServiceServicer(machine_pb2_grpc.MachineServiceServicer):
         Initializes the service servicer with a message queue and a logger.
         
         Parameters:
-            message_queue (queue.Queue): A thread-safe queue for storing incoming messages.
+            message_queue (collections.deque): A queue for storing incoming messages.
+                deque.append/popleft are atomic in CPython, so the single
+                producer (gRPC worker) and single consumer (run loop) need no lock.
             logger (logging.Logger): A logger instance for recording events.
         """
         self.message_queue = message_queue
@@ -66,11 +151,9 @@ class MachineServiceServicer(machine_pb2_grpc.MachineServiceServicer):
         Returns:
             machine_pb2.Ack: An acknowledgement message indicating success.
         """
-        log_entry = (f"Received message from {request.machine_id}: "
-                     f"received_clock={request.logical_clock}, "
-                     f"system_time={request.system_time}")
-        self.logger.info(log_entry)
-        self.message_queue.put(request)
+        self.logger.info("Received message from %s: received_clock=%d, system_time=%d",
+                         request.machine_id, request.logical_clock, request.system_time)
+        self.message_queue.append(request)
         return machine_pb2.Ack(success=True)
 
 class VirtualMachine:
@@ -85,107 +168,288 @@ class VirtualMachine:
     This implementation supports running with 4 machines, where each machine's peer_addresses
     should include the addresses of all the other machines.
     """
-    def __init__(self, machine_id, port, peer_addresses):
+    def __init__(self, machine_id, port, peer_addresses, console_level=logging.WARNING,
+                 server_pool=None):
         """
         Initializes the virtual machine with its identifier, network port, and peer addresses.
-        
+
         Sets up the message queue, logical clock, tick rate, and logging mechanisms.
-        
+
         Parameters:
             machine_id (str): Unique identifier for the virtual machine.
             port (int): Port number on which the gRPC server will listen.
             peer_addresses (list): List of peer addresses (e.g., ["localhost:50052", "localhost:50053", "localhost:50054"]).
+            console_level (int): Minimum level echoed to the console. Defaults
+                to WARNING so per-tick INFO events only go to the log file and
+                a slow or blocked terminal cannot stall the listener thread.
+            server_pool (ThreadPoolExecutor): Executor for the gRPC server's
+                handlers. Defaults to the process-wide shared pool; pass a
+                dedicated pool to isolate this machine's server.
         """
         self.machine_id = machine_id
         self.port = port
-        self.peer_addresses = peer_addresses  # e.g. ["localhost:50052", "localhost:50053", "localhost:50054"] for 4 machines.
-        self.message_queue = queue.Queue()      # Unconstrained network queue.
+        self._server_pool = server_pool
+        # Peers as an immutable tuple with the length cached: both are read
+        # on every send and broadcast, and tuple indexing is marginally
+        # cheaper than list indexing.
+        # e.g. ("localhost:50052", "localhost:50053", "localhost:50054") for 4 machines.
+        self.peer_addresses = tuple(peer_addresses)
+        self._n_peers = len(self.peer_addresses)
+        self.message_queue = deque()            # Unconstrained network queue.
         self.logical_clock = 0
         self.tick_rate = random.randint(MIN_TICKS, MAX_TICKS)
+        self.tick_period = 1.0 / self.tick_rate
         self.server = None
 
+        # Persistent gRPC channels and stubs, one per peer, so each send
+        # reuses an established connection instead of paying channel setup.
+        # Keepalive pings hold the HTTP/2 connection open across idle spells.
+        self._channels = {peer: grpc.insecure_channel(peer, options=_CHANNEL_OPTIONS)
+                          for peer in self.peer_addresses}
+        self._stubs = {peer: machine_pb2_grpc.MachineServiceStub(channel)
+                       for peer, channel in self._channels.items()}
+
+        # Raw-bytes variants of SendClockMessage, one per peer, used by
+        # broadcasts: with no request serializer the payload is serialized
+        # once by the caller instead of once per peer by each stub call.
+        self._raw_sends = {
+            peer: channel.unary_unary(
+                '/distributed.MachineService/SendClockMessage',
+                request_serializer=None,
+                response_deserializer=machine_pb2.Ack.FromString)
+            for peer, channel in self._channels.items()}
+
+        # Reusable outgoing message: only the simulation thread mutates it, so
+        # per-send protobuf construction is avoided entirely.
+        self._msg = machine_pb2.ClockMessage(machine_id=self.machine_id)
+
+        # Outbound single-peer sends are decoupled from the tick schedule by
+        # a dedicated sender thread. The tick loop appends (peer, clock, time)
+        # tuples to this deque (append/popleft are atomic in CPython, so the
+        # single producer and single consumer need no lock) and the sender
+        # thread issues the RPCs, so a send costs the tick loop one append
+        # instead of a network round trip.
+        self._send_queue = deque()
+        self._sender_running = True
+        self._sender_thread = threading.Thread(target=self._sender_loop,
+                                               daemon=True)
+        self._sender_thread.start()
+
+        # Batched random draws: one vectorized refill every RNG_BATCH_SIZE
+        # ticks instead of a Python-level random call per tick. Indices start
+        # exhausted so the first use triggers a fill.
+        self._rng = np.random.default_rng()
+        self._event_batch = self._peer_batch = None
+        self._event_idx = self._peer_idx = RNG_BATCH_SIZE
+
         # Set up logging to a file named after the machine.
         self.logger = logging.getLogger(self.machine_id)
         self.logger.setLevel(logging.INFO)
         formatter = logging.Formatter('%(asctime)s %(levelname)s: %(message)s')
-        file_handler = logging.FileHandler(f'{self.machine_id}_log.txt')
+        file_handler = BufferedFileHandler(f'{self.machine_id}_log.txt')
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-        # Also log to console.
+        # Also log to console, gated to console_level (WARNING by default).
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        console_handler.setLevel(console_level)
+        # Route records through an in-memory queue drained by a listener
+        # thread, so the simulation thread never blocks on file/console I/O.
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True)
+        self._log_listener.start()
 
-        self.logger.info(f"Machine {self.machine_id} initialized with tick rate {self.tick_rate} ticks per second")
+        self.logger.info("Machine %s initialized with tick rate %d ticks per second",
+                         self.machine_id, self.tick_rate)
 
     def start_server(self):
         """
         Starts the gRPC server to listen for incoming clock messages.
-        
+
         Creates a gRPC server with a thread pool executor, registers the
-        MachineServiceServicer, binds the server to the specified port, and starts it.
+        MachineServiceServicer, binds the server, and starts it. When the
+        peer addresses use the unix: scheme the server binds a Unix domain
+        socket named after the machine (unix:/tmp/vm_<id>.sock) instead of
+        a TCP port: loopback peers then skip the kernel TCP stack entirely,
+        which cuts small-message RPC latency. TCP remains the default.
         """
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+        # Servers in this process share one worker pool (unless one was
+        # injected): handlers only append to the queue, so workers are
+        # borrowed briefly and a pool per server would just multiply idle
+        # threads contending for the GIL with the simulation loops.
+        self.server = grpc.server(self._server_pool or _shared_server_pool())
         machine_pb2_grpc.add_MachineServiceServicer_to_server(
             MachineServiceServicer(self.message_queue, self.logger), self.server)
-        self.server.add_insecure_port(f'[::]:{self.port}')
+        if any(peer.startswith('unix:') for peer in self.peer_addresses):
+            address = f'unix:/tmp/vm_{self.machine_id}.sock'
+            socket_path = address[len('unix:'):]
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)  # stale socket from a previous run
+        else:
+            address = f'[::]:{self.port}'
+        self.server.add_insecure_port(address)
         self.server.start()
-        self.logger.info(f"gRPC server started on port {self.port}")
+        self.logger.info("gRPC server started on %s", address)
 
-    def send_message(self, target, logical_clock):
+    def send_message(self, target, logical_clock, system_time):
         """
-        Sends a clock message to a target machine using gRPC.
-        
-        Establishes a gRPC channel to the target, sends a ClockMessage containing
-        the machine's identifier, logical clock, and system time, and logs the event.
-        
+        Queues a clock message for delivery to a target machine.
+
+        The tick loop only appends the send to the outbound queue; the
+        dedicated sender thread performs the actual RPC over the persistent
+        channel and logs the outcome, so the tick schedule never waits on a
+        network round trip.
+
         Parameters:
             target (str): The target machine's address (e.g., "localhost:50052").
             logical_clock (int): The current logical clock value to be sent.
+            system_time (int): The system time for this tick, as a Unix timestamp.
+        """
+        self._send_queue.append((target, logical_clock, system_time))
+
+    def _sender_loop(self):
+        """
+        Drains the outbound queue and issues the RPCs.
+
+        Runs on the dedicated sender thread with its own message instance so
+        it never races the simulation thread's reusable template. Polls with
+        a short sleep when idle; after stop_server clears the running flag
+        the loop drains whatever is still queued and exits.
+        """
+        send_queue = self._send_queue
+        msg = machine_pb2.ClockMessage(machine_id=self.machine_id)
+        while True:
+            try:
+                target, logical_clock, system_time = send_queue.popleft()
+            except IndexError:
+                if not self._sender_running:
+                    return
+                time.sleep(0.001)
+                continue
+            msg.logical_clock = logical_clock
+            msg.system_time = system_time
+            try:
+                response = self._stubs[target].SendClockMessage(msg)
+                if response.success:
+                    self.logger.info("Sent message to %s: sent_clock=%d, system_time=%d",
+                                     target, logical_clock, system_time)
+            except grpc.RpcError as e:
+                self.logger.error("Error sending message to %s: %s", target, e)
+
+    def _next_event(self):
+        """
+        Returns the next event number in [1, 10], refilling the batch of
+        random draws when it is exhausted.
+        """
+        if self._event_idx == RNG_BATCH_SIZE:
+            self._event_batch = self._rng.integers(1, 11, size=RNG_BATCH_SIZE)
+            self._event_idx = 0
+        event = int(self._event_batch[self._event_idx])
+        self._event_idx += 1
+        return event
+
+    def _choose_peer(self):
+        """
+        Returns a uniformly random peer address, drawing from a batch of
+        precomputed indices that is refilled when exhausted.
+        """
+        if self._peer_idx == RNG_BATCH_SIZE:
+            self._peer_batch = self._rng.integers(0, self._n_peers,
+                                                  size=RNG_BATCH_SIZE)
+            self._peer_idx = 0
+        peer = self.peer_addresses[self._peer_batch[self._peer_idx]]
+        self._peer_idx += 1
+        return peer
+
+    def _log_send_result(self, peer, future, logical_clock, system_time,
+                         quiet=False):
+        """
+        Done callback for an asynchronous send: logs the outcome of the RPC.
+
+        Runs on a gRPC completion thread; the logger is safe to call there
+        because records only pass through the queue handler.
+
+        Parameters:
+            peer (str): The peer address the message was sent to.
+            future: The completed gRPC call future.
+            logical_clock (int): The logical clock value that was sent.
+            system_time (int): The system time that was sent, as a Unix timestamp.
+            quiet (bool): When True, log the success at DEBUG instead of INFO.
+              Used by broadcasts, which emit their own aggregate record.
         """
-        channel = grpc.insecure_channel(target)
-        stub = machine_pb2_grpc.MachineServiceStub(channel)
-        system_time = int(time.time())
-        message = machine_pb2.ClockMessage(
-            machine_id=self.machine_id,
-            logical_clock=logical_clock,
-            system_time=system_time
-        )
         try:
-            response = stub.SendClockMessage(message)
+            response = future.result()
             if response.success:
-                log_entry = (f"Sent message to {target}: "
-                             f"sent_clock={logical_clock}, system_time={system_time}")
-                self.logger.info(log_entry)
+                log = self.logger.debug if quiet else self.logger.info
+                log("Sent message to %s: sent_clock=%d, system_time=%d",
+                    peer, logical_clock, system_time)
         except grpc.RpcError as e:
-            self.logger.error(f"Error sending message to {target}: {e}")
+            self.logger.error("Error sending message to %s: %s", peer, e)
 
-    def log_internal_event(self):
+    def _broadcast(self, logical_clock, system_time):
+        """
+        Sends a clock message to every peer concurrently.
+
+        Dispatches one asynchronous RPC per peer via the stub future API and
+        returns immediately; a done callback on each future logs the outcome
+        from the gRPC completion thread. The request is serialized when the
+        call is issued, so reusing the message template across ticks is safe,
+        and the tick loop never stalls on a slow peer's round trip.
+
+        The identical payload goes to every peer, so the message is
+        serialized to wire bytes exactly once here and dispatched through
+        the raw-bytes call variants instead of being re-encoded per stub
+        call.
+
+        Per-peer successes are logged at DEBUG only: the caller records one
+        aggregate "Broadcast sent" entry, so a broadcast costs a single INFO
+        record instead of one per peer plus the summary. Errors still surface
+        at ERROR level.
+
+        Parameters:
+            logical_clock (int): The current logical clock value to be sent.
+            system_time (int): The system time for this tick, as a Unix timestamp.
+        """
+        self._msg.logical_clock = logical_clock
+        self._msg.system_time = system_time
+        payload = self._msg.SerializeToString()
+        for peer in self.peer_addresses:
+            future = self._raw_sends[peer].future(payload)
+            future.add_done_callback(
+                lambda fut, peer=peer: self._log_send_result(
+                    peer, fut, logical_clock, system_time, quiet=True))
+
+    def log_internal_event(self, logical_clock, system_time):
         """
         Logs an internal event where the machine updates its logical clock
         without sending or receiving a message.
-        
-        The log entry includes the updated logical clock and the current system time.
+
+        The log entry includes the updated logical clock and the system time
+        for this tick.
+
+        Parameters:
+            logical_clock (int): The logical clock value after the update.
+            system_time (int): The system time for this tick, as a Unix timestamp.
         """
-        system_time = int(time.time())
-        log_entry = (f"Internal event: updated logical clock to {self.logical_clock}, "
-                     f"system_time={system_time}")
-        self.logger.info(log_entry)
+        self.logger.info("Internal event: updated logical clock to %d, system_time=%d",
+                         logical_clock, system_time)
 
-    def log_receive_event(self, queue_length):
+    def log_receive_event(self, logical_clock, queue_length, system_time):
         """
         Logs an event for processing a received message.
-        
+
         The log entry includes the updated logical clock, the system time,
         and the current message queue length.
-        
+
         Parameters:
+            logical_clock (int): The logical clock value after the update.
             queue_length (int): The current number of messages in the queue.
+            system_time (int): The system time for this tick, as a Unix timestamp.
         """
-        system_time = int(time.time())
-        log_entry = (f"Processed received message: updated logical clock to {self.logical_clock}, "
-                     f"system_time={system_time}, queue_length={queue_length}")
-        self.logger.info(log_entry)
+        self.logger.info("Processed received message: updated logical clock to %d, "
+                         "system_time=%d, queue_length=%d",
+                         logical_clock, system_time, queue_length)
 
     def run(self, duration=60):
         """
@@ -198,72 +462,122 @@ class VirtualMachine:
               otherwise an internal event occurs.
             * In tight mode, a send event occurs if the random number is <= 6 (60% chance),
               making internal events less likely.
-          - Enforces a fixed tick rate as defined by the machine's tick_rate.
-        
+          - Enforces a fixed tick rate by sleeping until an absolute deadline
+            derived from the monotonic clock, so scheduling drift does not
+            accumulate and wall-clock adjustments cannot stall the loop.
+
         Parameters:
             duration (int): Duration in seconds for which the simulation will run.
         """
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            tick_start = time.time()
-            if not self.message_queue.empty():
-                # Process one message from the queue.
-                message = self.message_queue.get()
-                # Update logical clock: max(local_clock, received_clock) + 1.
-                self.logical_clock = max(self.logical_clock, message.logical_clock) + 1
-                self.log_receive_event(self.message_queue.qsize())
-            else:
-                event = random.randint(1, 10)
-                if TIGHT_MODE:
-                    # In tight mode, send events are more likely (60% chance to send).
-                    if event <= 6:
-                        self.logical_clock += 1
-                        system_time = int(time.time())
-                        # Alternate between broadcast and random send.
-                        if event % 2 == 0:
-                            for peer in self.peer_addresses:
-                                self.send_message(peer, self.logical_clock)
-                            self.logger.info(f"Broadcast sent: updated logical clock to {self.logical_clock}, system_time={system_time}")
-                        else:
-                            peer = random.choice(self.peer_addresses)
-                            self.send_message(peer, self.logical_clock)
-                            self.logger.info(f"Sent event to {peer}: updated logical clock to {self.logical_clock}, system_time={system_time}")
-                    else:
-                        self.logical_clock += 1
-                        self.log_internal_event()
+        # Hoist hot attributes and bound methods into locals: local loads are
+        # several times cheaper than attribute lookups in CPython, and this
+        # loop runs tick_rate times per second.
+        tick_period = self.tick_period
+        message_queue = self.message_queue
+        logger_info = self.logger.info
+        send_message = self.send_message
+        broadcast = self._broadcast
+        next_event = self._next_event
+        choose_peer = self._choose_peer
+        log_internal_event = self.log_internal_event
+        log_receive_event = self.log_receive_event
+        tight_mode = TIGHT_MODE
+        receive_burst = RECEIVE_BURST
+        monotonic = time.monotonic
+        sleep = time.sleep
+        logical_clock = self.logical_clock
+
+        start_time = monotonic()
+        end_time = start_time + duration
+        next_tick = start_time + tick_period
+        try:
+            while monotonic() < end_time:
+                # One system-time read per tick, shared by every log entry below.
+                system_time = int(time.time())
+                if message_queue:
+                    # Drain a burst of queued messages, folding the Lamport
+                    # update max(local_clock, received_clock) + 1 through each
+                    # one, and log a single record for the burst. EAFP inside
+                    # the loop: popleft and catch IndexError at the end of the
+                    # burst rather than re-checking the deque per message.
+                    drained = 0
+                    while drained < receive_burst:
+                        try:
+                            message = message_queue.popleft()
+                        except IndexError:
+                            break
+                        logical_clock = max(logical_clock, message.logical_clock) + 1
+                        drained += 1
+                    log_receive_event(logical_clock, len(message_queue), system_time)
                 else:
-                    # Default mode: 30% chance to send, 70% chance for internal event.
-                    if event in (1, 2, 3):
-                        self.logical_clock += 1
-                        system_time = int(time.time())
-                        if event == 3:
-                            for peer in self.peer_addresses:
-                                self.send_message(peer, self.logical_clock)
-                            self.logger.info(f"Broadcast sent: updated logical clock to {self.logical_clock}, system_time={system_time}")
+                    event = next_event()
+                    if tight_mode:
+                        # In tight mode, send events are more likely (60% chance to send).
+                        if event <= 6:
+                            logical_clock += 1
+                            # Alternate between broadcast and random send.
+                            if event % 2 == 0:
+                                broadcast(logical_clock, system_time)
+                                logger_info("Broadcast sent: updated logical clock to %d, system_time=%d",
+                                            logical_clock, system_time)
+                            else:
+                                peer = choose_peer()
+                                send_message(peer, logical_clock, system_time)
+                                logger_info("Sent event to %s: updated logical clock to %d, system_time=%d",
+                                            peer, logical_clock, system_time)
                         else:
-                            peer = random.choice(self.peer_addresses)
-                            self.send_message(peer, self.logical_clock)
-                            self.logger.info(f"Sent event to {peer}: updated logical clock to {self.logical_clock}, system_time={system_time}")
+                            logical_clock += 1
+                            log_internal_event(logical_clock, system_time)
                     else:
-                        self.logical_clock += 1
-                        self.log_internal_event()
+                        # Default mode: 30% chance to send, 70% chance for internal event.
+                        if event in (1, 2, 3):
+                            logical_clock += 1
+                            if event == 3:
+                                broadcast(logical_clock, system_time)
+                                logger_info("Broadcast sent: updated logical clock to %d, system_time=%d",
+                                            logical_clock, system_time)
+                            else:
+                                peer = choose_peer()
+                                send_message(peer, logical_clock, system_time)
+                                logger_info("Sent event to %s: updated logical clock to %d, system_time=%d",
+                                            peer, logical_clock, system_time)
+                        else:
+                            logical_clock += 1
+                            log_internal_event(logical_clock, system_time)
 
-            # Enforce the tick rate.
-            time_to_next_tick = max(0, (1 / self.tick_rate) - (time.time() - tick_start))
-            time.sleep(time_to_next_tick)
+                # Sleep until the next absolute tick deadline.
+                now = monotonic()
+                if now < next_tick:
+                    sleep(next_tick - now)
+                next_tick += tick_period
+        finally:
+            # Publish the clock back to the instance, including on interrupt.
+            self.logical_clock = logical_clock
 
     def stop_server(self):
         """
         Stops the gRPC server if it is running.
         
-        This method shuts down the server and logs the shutdown event.
+        This method drains the sender thread, closes the peer channels,
+        shuts down the server, and logs the shutdown event.
         """
+        # Let the sender thread flush any queued messages, then stop it.
+        self._sender_running = False
+        self._sender_thread.join(timeout=5)
+        for channel in self._channels.values():
+            channel.close()
         if self.server:
             self.server.stop(0)
             self.logger.info("gRPC server stopped")
+        # Drain any queued records before the process exits.
+        self._log_listener.stop()
 
 if __name__ == '__main__':
-    # args.machine_id, args.port, args.peer_addresses have been parsed already.
+    args = parse_args()
+    TIGHT_MODE = args.tight
+    MIN_TICKS = args.min_ticks
+    MAX_TICKS = args.max_ticks
+
     machine_id = args.machine_id
     port = args.port
     # For a 4-machine configuration, peer_addresses should be a comma-separated list of 3 addresses.